@@ -1,32 +1,38 @@
 """
 Disjoint Set (Union-Find) data structure for managing puzzle regions.
 """
-from typing import Dict, List, Set, Any, Optional
+from array import array
+from typing import Dict, Iterator, List, Set, Tuple, Any, Optional
 
 
 class DisjointSet:
     """
-    Union-Find data structure with path compression and union by rank.
+    Union-Find data structure with path compression and union by size.
     Used to manage connected regions in the puzzle grid.
     """
 
     def __init__(self):
         self.parent: Dict[Any, Any] = {}
-        self.rank: Dict[Any, int] = {}
+        self.size: Dict[Any, int] = {}  # Only meaningful for roots
+        self.members: Dict[Any, Set[Any]] = {}  # root -> all elements in its set
 
     def make_set(self, x: Any) -> None:
         """Create a new set containing only x."""
         if x not in self.parent:
             self.parent[x] = x
-            self.rank[x] = 0
+            self.size[x] = 1
+            self.members[x] = {x}
 
     def find(self, x: Any) -> Any:
-        """Find the representative of x's set with path compression."""
-        if x not in self.parent:
-            self.make_set(x)
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])  # Path compression
-        return self.parent[x]
+        """
+        Find the representative of x's set with path halving.
+        x must already have been added with make_set.
+        """
+        p = self.parent
+        while p[x] != x:
+            p[x] = p[p[x]]  # Point at grandparent
+            x = p[x]
+        return x
 
     def union(self, x: Any, y: Any) -> bool:
         """
@@ -39,15 +45,12 @@ class DisjointSet:
         if root_x == root_y:
             return False  # Already in same set
 
-        # Union by rank
-        if self.rank[root_x] < self.rank[root_y]:
-            self.parent[root_x] = root_y
-        elif self.rank[root_x] > self.rank[root_y]:
-            self.parent[root_y] = root_x
-        else:
-            self.parent[root_y] = root_x
-            self.rank[root_x] += 1
-
+        # Union by size: attach the smaller tree under the larger
+        if self.size[root_x] < self.size[root_y]:
+            root_x, root_y = root_y, root_x
+        self.parent[root_y] = root_x
+        self.size[root_x] += self.size[root_y]
+        self.members[root_x] |= self.members.pop(root_y)
         return True
 
     def connected(self, x: Any, y: Any) -> bool:
@@ -56,46 +59,143 @@ class DisjointSet:
 
     def get_sets(self) -> Dict[Any, Set[Any]]:
         """Return all sets as a dict mapping representative -> members."""
-        sets: Dict[Any, Set[Any]] = {}
-        for x in self.parent:
-            root = self.find(x)
-            if root not in sets:
-                sets[root] = set()
-            sets[root].add(x)
-        return sets
+        return {root: set(members) for root, members in self.members.items()}
 
     def get_set(self, x: Any) -> Set[Any]:
-        """Return all members of x's set."""
-        root = self.find(x)
-        return {y for y in self.parent if self.find(y) == root}
+        """Return a copy of all members of x's set."""
+        return set(self.members[self.find(x)])
 
     def set_size(self, x: Any) -> int:
         """Return the size of x's set."""
-        return len(self.get_set(x))
+        return self.size[self.find(x)]
 
     def num_sets(self) -> int:
         """Return the number of disjoint sets."""
-        return len(self.get_sets())
+        return len(self.members)
+
+
+class DisjointSetArray:
+    """
+    Union-Find over the dense integer universe 0..n-1.
+    Parent and size live in flat arrays instead of dicts, which suits
+    cell ids encoded as row * cols + col.
+    """
+
+    def __init__(self, n: int):
+        self.parent = array('i', range(n))
+        self.size = array('i', [1]) * n  # Only meaningful for roots
+        # root -> members, only for roots of merged sets; singletons are implicit
+        self.members: Dict[int, Set[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def find(self, x: int) -> int:
+        """Find the representative of x's set with path halving."""
+        p = self.parent
+        while p[x] != x:
+            p[x] = p[p[x]]
+            x = p[x]
+        return x
+
+    def union(self, x: int, y: int) -> bool:
+        """
+        Merge the sets containing x and y.
+        Returns True if they were in different sets, False if already same set.
+        """
+        root_x = self.find(x)
+        root_y = self.find(y)
+
+        if root_x == root_y:
+            return False
+
+        size = self.size
+        if size[root_x] < size[root_y]:
+            root_x, root_y = root_y, root_x
+        self.parent[root_y] = root_x
+        size[root_x] += size[root_y]
+        members = self.members
+        merged = members.get(root_x)
+        if merged is None:
+            merged = members[root_x] = {root_x}
+        absorbed = members.pop(root_y, None)
+        if absorbed is None:
+            merged.add(root_y)
+        else:
+            merged |= absorbed
+        return True
+
+    def connected(self, x: int, y: int) -> bool:
+        """Check if x and y are in the same set."""
+        return self.find(x) == self.find(y)
+
+    def get_sets(self) -> Dict[int, Set[int]]:
+        """Return all sets as a dict mapping representative -> members."""
+        members = self.members
+        return {x: set(members.get(x, (x,)))
+                for x, px in enumerate(self.parent) if x == px}
+
+    def get_set(self, x: int) -> Set[int]:
+        """Return a copy of all members of x's set."""
+        root = self.find(x)
+        return set(self.members.get(root, (root,)))
+
+    def set_size(self, x: int) -> int:
+        """Return the size of x's set."""
+        return self.size[self.find(x)]
+
+    def num_sets(self) -> int:
+        """Return the number of disjoint sets."""
+        return sum(1 for x, px in enumerate(self.parent) if x == px)
+
+
+def iter_bits(mask: int) -> Iterator[int]:
+    """Yield the index of each set bit in mask, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
 
 
 class RegionManager:
     """
     Manages puzzle regions using disjoint sets.
     Each region has a constraint (e.g., sum of pips).
+    Cells are packed int ids (row * cols + col); use encode/decode to convert.
     """
 
-    def __init__(self):
-        self.ds = DisjointSet()
+    def __init__(self, rows: int, cols: int):
+        self._cols = cols
+        self.ds = DisjointSetArray(rows * cols)
         self.constraints: Dict[Any, int] = {}  # region_id -> target sum
-        self.cell_to_region: Dict[tuple, Any] = {}  # (row, col) -> region_id
+        self.cell_to_region: Dict[int, Any] = {}  # cell id -> region_id
+        self.region_masks: Dict[Any, int] = {}  # region_id -> bitmask of cell ids
+
+    def encode(self, row: int, col: int) -> int:
+        """Pack (row, col) into a cell id."""
+        return row * self._cols + col
+
+    def decode(self, cell: int) -> Tuple[int, int]:
+        """Unpack a cell id into (row, col)."""
+        return divmod(cell, self._cols)
 
-    def add_cell(self, row: int, col: int, region_id: Any) -> None:
+    def add_cell(self, cell: int, region_id: Any) -> None:
         """Add a cell to a region."""
-        cell = (row, col)
-        self.ds.make_set(cell)
+        # Keep the inverted index in sync if the cell is being reassigned
+        if cell in self.cell_to_region:
+            old_region = self.cell_to_region[cell]
+            if old_region == region_id:
+                return
+            old_mask = self.region_masks[old_region] & ~(1 << cell)
+            if old_mask:
+                self.region_masks[old_region] = old_mask
+            else:
+                del self.region_masks[old_region]
+
         self.cell_to_region[cell] = region_id
+        self.region_masks[region_id] = self.region_masks.get(region_id, 0) | (1 << cell)
 
-    def merge_cells(self, cell1: tuple, cell2: tuple) -> None:
+    def merge_cells(self, cell1: int, cell2: int) -> None:
         """Merge two cells into the same region."""
         self.ds.union(cell1, cell2)
 
@@ -107,13 +207,17 @@ class RegionManager:
         """Get the target sum for a region."""
         return self.constraints.get(region_id)
 
-    def get_region_cells(self, region_id: Any) -> List[tuple]:
-        """Get all cells belonging to a region."""
-        return [cell for cell, rid in self.cell_to_region.items() if rid == region_id]
+    def get_region_mask(self, region_id: Any) -> int:
+        """Get a region's cells as a bitmask (bit i set for cell id i)."""
+        return self.region_masks.get(region_id, 0)
+
+    def get_region_cells(self, region_id: Any) -> List[int]:
+        """Get all cells belonging to a region, in ascending id order."""
+        return list(iter_bits(self.get_region_mask(region_id)))
 
     def get_all_regions(self) -> Set[Any]:
         """Get all unique region IDs."""
-        return set(self.cell_to_region.values())
+        return set(self.region_masks)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,110 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Cython port of DisjointSetArray for dense integer ids (0..n-1).
+find/union run on plain C arrays with no Python objects in the loop.
+Compile: cythonize -i -3 disjoint_set_c.pyx
+"""
+from cpython.mem cimport PyMem_Malloc, PyMem_Free
+
+
+cdef class DisjointSetC:
+    """Union-Find with path halving and union by size over C arrays."""
+
+    cdef int n
+    cdef int num_roots
+    cdef int* parent
+    cdef int* size  # Only meaningful for roots
+
+    def __cinit__(self, int n):
+        cdef int i
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        self.n = n
+        self.num_roots = n
+        self.parent = <int*>PyMem_Malloc(max(n, 1) * sizeof(int))
+        self.size = <int*>PyMem_Malloc(max(n, 1) * sizeof(int))
+        if self.parent == NULL or self.size == NULL:
+            raise MemoryError()
+        for i in range(n):
+            self.parent[i] = i
+            self.size[i] = 1
+
+    def __dealloc__(self):
+        PyMem_Free(self.parent)
+        PyMem_Free(self.size)
+
+    def __len__(self):
+        return self.n
+
+    cdef inline int _find(self, int x) nogil:
+        cdef int* p = self.parent
+        while p[x] != x:
+            p[x] = p[p[x]]
+            x = p[x]
+        return x
+
+    cdef inline void _check(self, int x) except *:
+        if x < 0 or x >= self.n:
+            raise IndexError(f"element {x} out of range for {self.n} elements")
+
+    def find(self, int x) -> int:
+        """Find the representative of x's set with path halving."""
+        self._check(x)
+        return self._find(x)
+
+    def union(self, int x, int y) -> bool:
+        """
+        Merge the sets containing x and y.
+        Returns True if they were in different sets, False if already same set.
+        """
+        cdef int root_x, root_y, tmp
+        self._check(x)
+        self._check(y)
+        root_x = self._find(x)
+        root_y = self._find(y)
+
+        if root_x == root_y:
+            return False
+
+        if self.size[root_x] < self.size[root_y]:
+            tmp = root_x
+            root_x = root_y
+            root_y = tmp
+        self.parent[root_y] = root_x
+        self.size[root_x] += self.size[root_y]
+
+        self.num_roots -= 1
+        return True
+
+    def connected(self, int x, int y) -> bool:
+        """Check if x and y are in the same set."""
+        self._check(x)
+        self._check(y)
+        return self._find(x) == self._find(y)
+
+    def get_sets(self) -> dict:
+        """Return all sets as a dict mapping representative -> members."""
+        cdef int x, root
+        sets = {}
+        for x in range(self.n):
+            root = self._find(x)
+            if root not in sets:
+                sets[root] = set()
+            sets[root].add(x)
+        return sets
+
+    def get_set(self, int x) -> set:
+        """Return all members of x's set."""
+        cdef int y, root
+        self._check(x)
+        root = self._find(x)
+        return {y for y in range(self.n) if self._find(y) == root}
+
+    def set_size(self, int x) -> int:
+        """Return the size of x's set."""
+        self._check(x)
+        return self.size[self._find(x)]
+
+    def num_sets(self) -> int:
+        """Return the number of disjoint sets."""
+        return self.num_roots
@@ -1,27 +1,43 @@
 """
 Domino set definitions and utilities.
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cache
 from typing import List, Set, Tuple
 import random
 
+# Dominoes can be packed into a single small int: low * 10 + high.
+# Every double-nine tile fits in one byte, and the tables below decode
+# a code without building a Domino.
+DominoCode = int
+DOMINO_LOW = bytes(code // 10 for code in range(100))
+DOMINO_HIGH = bytes(code % 10 for code in range(100))
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Domino:
-    """A domino tile with two pip values."""
+    """
+    A domino tile with two pip values.
+    Construct with low <= high; use Domino.canonical() for unordered input.
+    """
     low: int
     high: int
+    pips: int = field(init=False, repr=False, compare=False)  # Total pip count
+    code: DominoCode = field(init=False, repr=False, compare=False)  # low * 10 + high
 
     def __post_init__(self):
-        # Ensure low <= high for canonical form
-        if self.low > self.high:
-            object.__setattr__(self, 'low', self.high)
-            object.__setattr__(self, 'high', self.low)
+        object.__setattr__(self, 'pips', self.low + self.high)
+        object.__setattr__(self, 'code', self.low * 10 + self.high)
 
-    @property
-    def pips(self) -> int:
-        """Total pip count."""
-        return self.low + self.high
+    @classmethod
+    def canonical(cls, a: int, b: int) -> 'Domino':
+        """Create a domino from pip values in either order."""
+        return cls(a, b) if a <= b else cls(b, a)
+
+    @classmethod
+    def from_code(cls, code: DominoCode) -> 'Domino':
+        """Create a domino from its packed code."""
+        return cls(DOMINO_LOW[code], DOMINO_HIGH[code])
 
     @property
     def is_double(self) -> bool:
@@ -31,13 +47,23 @@ class Domino:
     def __repr__(self):
         return f"[{self.low}|{self.high}]"
 
-    def __hash__(self):
-        return hash((self.low, self.high))
 
-    def __eq__(self, other):
-        if not isinstance(other, Domino):
-            return False
-        return self.low == other.low and self.high == other.high
+@cache
+def _double_six() -> Tuple[Domino, ...]:
+    """All 28 double-six tiles, built once."""
+    return tuple(Domino(i, j) for i in range(7) for j in range(i, 7))
+
+
+@cache
+def _double_nine() -> Tuple[Domino, ...]:
+    """All 55 double-nine tiles, built once."""
+    return tuple(Domino(i, j) for i in range(10) for j in range(i, 10))
+
+
+@cache
+def _double_nine_remainder() -> Tuple[Domino, ...]:
+    """The 27 double-nine tiles with at least one side >= 7, built once."""
+    return tuple(d for d in _double_nine() if d.high >= 7)
 
 
 class DominoSet:
@@ -49,20 +75,12 @@ class DominoSet:
     @classmethod
     def double_six(cls) -> 'DominoSet':
         """Create a standard double-six set (28 tiles, 0-6)."""
-        dominoes = []
-        for i in range(7):
-            for j in range(i, 7):
-                dominoes.append(Domino(i, j))
-        return cls(dominoes)
+        return cls(_double_six())
 
     @classmethod
     def double_nine(cls) -> 'DominoSet':
         """Create a double-nine set (55 tiles, 0-9)."""
-        dominoes = []
-        for i in range(10):
-            for j in range(i, 10):
-                dominoes.append(Domino(i, j))
-        return cls(dominoes)
+        return cls(_double_nine())
 
     @classmethod
     def double_nine_remainder(cls) -> 'DominoSet':
@@ -71,12 +89,7 @@ class DominoSet:
         These are tiles with at least one side >= 7.
         (27 tiles)
         """
-        dominoes = []
-        for i in range(10):
-            for j in range(i, 10):
-                if i >= 7 or j >= 7:
-                    dominoes.append(Domino(i, j))
-        return cls(dominoes)
+        return cls(_double_nine_remainder())
 
     def subset(self, n: int) -> 'DominoSet':
         """Return a random subset of n dominoes."""
@@ -90,6 +103,10 @@ class DominoSet:
         random.shuffle(shuffled)
         return DominoSet(shuffled)
 
+    def shuffle_inplace(self) -> None:
+        """Shuffle this set's order in place, without copying."""
+        random.shuffle(self.dominoes)
+
     def __len__(self):
         return len(self.dominoes)
 
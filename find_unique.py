@@ -1,28 +1,115 @@
 """
 Targeted search for unique puzzles using specific constraint patterns.
 """
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Set, Tuple, Optional
+from functools import lru_cache
+from itertools import combinations
+import multiprocessing
 from domino_sets import Domino, DominoSet
 from grid import Puzzle, Region, PlacedDomino, Orientation, ConstraintType
 from solver import Solver
 
 
-def test_puzzle(dominoes, rows, cols, regions, name="Test") -> int:
-    """Test a puzzle configuration and return solution count."""
+RegionKey = Tuple[int, Tuple[Tuple[int, int], ...], ConstraintType, Optional[int], Optional[int]]
+
+
+def _region_key(region: Region) -> RegionKey:
+    """Hashable description of a region and its constraint."""
+    return (region.id, tuple(region.cells), region.constraint_type,
+            region.target_value, region.linked_region_id)
+
+
+@lru_cache(maxsize=None)
+def _solve_cached(domino_codes: bytes, rows: int, cols: int,
+                  region_keys: Tuple[RegionKey, ...]) -> Tuple[int, Optional[Tuple[PlacedDomino, ...]]]:
+    """Solve a puzzle given in key form. Returns (count, solution if unique)."""
+    regions = [Region(rid, list(cells), ctype, target_value=target, linked_region_id=linked)
+               for rid, cells, ctype, target, linked in region_keys]
     puzzle = Puzzle(
-        name=name,
+        name="",
         difficulty="test",
         rows=rows,
         cols=cols,
         regions=regions,
-        supply=DominoSet(dominoes),
+        supply=DominoSet([Domino.from_code(code) for code in domino_codes]),
         solution=[]
     )
-    solver = Solver(puzzle, max_solutions=5)
+    # Two solutions are enough to rule out uniqueness
+    solver = Solver(puzzle, max_solutions=2)
     count = solver.solve()
-    if count == 1:
-        puzzle.solution = solver.get_solution()
-    return count, puzzle if count == 1 else None
+    return count, tuple(solver.get_solution()) if count == 1 else None
+
+
+def test_puzzle(dominoes, rows, cols, regions, name="Test") -> Tuple[int, Optional[Puzzle]]:
+    """
+    Test a puzzle configuration and return (solution count, puzzle if unique).
+    The count stops at 2, so anything above 1 just means "multiple".
+    Results are memoized, so repeated configurations skip the Solver.
+    """
+    count, solution = _solve_cached(
+        bytes(d.code for d in dominoes), rows, cols,
+        tuple(_region_key(r) for r in regions)
+    )
+    if count != 1:
+        return count, None
+
+    puzzle = Puzzle(
+        name=name,
+        difficulty="test",
+        rows=rows,
+        cols=cols,
+        regions=regions,
+        supply=DominoSet(dominoes),
+        solution=list(solution)
+    )
+    return count, puzzle
+
+
+def achievable_region_sums(dominoes, region_cells) -> Set[Tuple[int, ...]]:
+    """
+    Return every tuple of region sums produced by some placement of all
+    dominoes over the region cells. Targets outside this set have no solution.
+    """
+    # Pack cells as row * width + col so coverage is a single int bitmask.
+    # The spare column keeps cell + 1 from wrapping onto the next row.
+    width = max(c for cells in region_cells for _, c in cells) + 2
+    cell_region = {r * width + c: i for i, cells in enumerate(region_cells) for r, c in cells}
+    all_mask = sum(1 << cell for cell in cell_region)
+    # Right and down partners of each cell, with the mask covering both
+    partners = {
+        cell: [(adj, (1 << cell) | (1 << adj))
+               for adj in (cell + 1, cell + width) if adj in cell_region]
+        for cell in cell_region
+    }
+    sums = [0] * len(region_cells)
+    used = [False] * len(dominoes)
+    results: Set[Tuple[int, ...]] = set()
+
+    def place(filled: int) -> None:
+        empty = all_mask & ~filled
+        if not empty:
+            results.add(tuple(sums))
+            return
+
+        # Lowest empty cell id is the first empty cell in row-major order
+        cell = (empty & -empty).bit_length() - 1
+        for adj, pair in partners[cell]:
+            if pair & filled:
+                continue
+            for i, d in enumerate(dominoes):
+                if used[i]:
+                    continue
+                used[i] = True
+                for a, b in {(d.low, d.high), (d.high, d.low)}:
+                    sums[cell_region[cell]] += a
+                    sums[cell_region[adj]] += b
+                    place(filled | pair)
+                    sums[cell_region[cell]] -= a
+                    sums[cell_region[adj]] -= b
+                used[i] = False
+
+    place(0)
+    return results
 
 
 def find_easy_1():
@@ -63,19 +150,17 @@ def find_easy_1():
         print(f"\n  Dominoes: {[str(d) for d in dominoes]}")
         print(f"  Sums: {sums}, Total: {total}")
 
-        # Try each possible region A sum
-        for target_a in range(total + 1):
-            target_b = total - target_a
-
-            # Check if target_a can be achieved by exactly 2 dominoes
-            ways_to_make_a = []
-            for i in range(len(dominoes)):
-                for j in range(i + 1, len(dominoes)):
-                    if sums[i] + sums[j] == target_a:
-                        ways_to_make_a.append((dominoes[i], dominoes[j]))
+        # Group domino pairs by their pip sum once, up front
+        ways_by_sum: Dict[int, List[Tuple[Domino, Domino]]] = {}
+        for i, j in combinations(range(len(dominoes)), 2):
+            ways_by_sum.setdefault(sums[i] + sums[j], []).append((dominoes[i], dominoes[j]))
 
+        # Only region A sums reachable by exactly one pair can be unique
+        for target_a in sorted(ways_by_sum):
+            ways_to_make_a = ways_by_sum[target_a]
             if len(ways_to_make_a) != 1:
-                continue  # Skip if multiple ways or no way
+                continue  # Skip if multiple ways
+            target_b = total - target_a
 
             regions = [
                 Region(0, region_cells[0], ConstraintType.SUM, target_value=target_a),
@@ -88,8 +173,8 @@ def find_easy_1():
                 print(f"  ✓ UNIQUE! Region A={target_a}, Region B={target_b}")
                 print(f"    Only way: {ways_to_make_a[0]}")
                 return puzzle
-            elif count > 0:
-                print(f"    Targets A={target_a}, B={target_b}: {count} solutions")
+            elif count >= 2:
+                print(f"    Targets A={target_a}, B={target_b}: multiple solutions")
 
     return None
 
@@ -119,26 +204,21 @@ def find_easy_2():
     ]
 
     for dominoes in test_sets:
-        sums = [d.pips for d in dominoes]
-        total = sum(sums)
         print(f"\n  Dominoes: {[str(d) for d in dominoes]}")
 
-        # Try different sum combinations for the 3 regions
-        for t0 in range(total + 1):
-            for t1 in range(total - t0 + 1):
-                t2 = total - t0 - t1
-
-                regions = [
-                    Region(0, region_cells[0], ConstraintType.SUM, target_value=t0),
-                    Region(1, region_cells[1], ConstraintType.SUM, target_value=t1),
-                    Region(2, region_cells[2], ConstraintType.SUM, target_value=t2),
-                ]
+        # Only sum combinations some placement can reach are worth solving
+        for t0, t1, t2 in sorted(achievable_region_sums(dominoes, region_cells)):
+            regions = [
+                Region(0, region_cells[0], ConstraintType.SUM, target_value=t0),
+                Region(1, region_cells[1], ConstraintType.SUM, target_value=t1),
+                Region(2, region_cells[2], ConstraintType.SUM, target_value=t2),
+            ]
 
-                count, puzzle = test_puzzle(dominoes, rows, cols, regions, "Easy 2")
+            count, puzzle = test_puzzle(dominoes, rows, cols, regions, "Easy 2")
 
-                if count == 1:
-                    print(f"  ✓ UNIQUE! Regions: {t0}, {t1}, {t2}")
-                    return puzzle
+            if count == 1:
+                print(f"  ✓ UNIQUE! Regions: {t0}, {t1}, {t2}")
+                return puzzle
 
     return None
 
@@ -187,8 +267,8 @@ def find_medium():
         if count == 1:
             print(f"  ✓ UNIQUE! A < B < C, C sum={target_c}")
             return puzzle
-        elif count > 0 and count <= 3:
-            print(f"    C sum={target_c}: {count} solutions")
+        elif count >= 2:
+            print(f"    C sum={target_c}: multiple solutions")
 
     # Try with 6 regions (one per domino position)
     print("\n  Trying 6-region layout...")
@@ -216,7 +296,7 @@ def find_medium():
         print(f"  ✓ UNIQUE! Full chain with 6 regions")
         return puzzle
     else:
-        print(f"    6-region chain: {count} solutions")
+        print(f"    6-region chain: {'multiple' if count >= 2 else 'no'} solutions")
 
     return None
 
@@ -268,8 +348,8 @@ def find_hard():
         if count == 1:
             print(f"  ✓ UNIQUE! A < B < C < D, D sum={target_d}")
             return puzzle
-        elif count > 0 and count <= 3:
-            print(f"    D sum={target_d}: {count} solutions")
+        elif count >= 2:
+            print(f"    D sum={target_d}: multiple solutions")
 
     return None
 
@@ -279,10 +359,12 @@ if __name__ == "__main__":
     print("TARGETED SEARCH FOR UNIQUE DOMINO PUZZLES")
     print("=" * 60)
 
-    easy1 = find_easy_1()
-    easy2 = find_easy_2()
-    medium = find_medium()
-    hard = find_hard()
+    # The four searches share no state, so run them side by side.
+    # Progress output from the workers may interleave.
+    searches = [find_easy_1, find_easy_2, find_medium, find_hard]
+    with multiprocessing.get_context("spawn").Pool(len(searches)) as pool:
+        pending = [pool.apply_async(search) for search in searches]
+        easy1, easy2, medium, hard = [p.get() for p in pending]
 
     print("\n" + "=" * 60)
     print("RESULTS SUMMARY")
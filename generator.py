@@ -2,8 +2,15 @@
 Puzzle generator that searches for puzzles with unique solutions.
 Uses reverse-engineering: start with solution, derive constraints, verify uniqueness.
 """
-from typing import List, Dict, Tuple, Optional, Set
+from typing import List, Deque, Dict, Iterable, Iterator, Sequence, Tuple, Optional
 from dataclasses import dataclass
+from array import array
+from functools import lru_cache
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from contextlib import closing
+import multiprocessing
+import os
 import random
 import itertools
 
@@ -21,98 +28,240 @@ class GenerationStats:
     multiple_solutions: int = 0
 
 
+Slot = Tuple[int, int, Orientation]
+
+
+@lru_cache(maxsize=None)
+def _tile_grid(rows: int, cols: int) -> Optional[Tuple[Slot, ...]]:
+    """
+    Find a domino tiling of the grid using backtracking.
+    Returns the (row, col, orientation) of each domino slot in placement
+    order, or None if the grid cannot be tiled.
+    """
+    full = (1 << (rows * cols)) - 1
+    slots: List[Optional[Slot]] = [None] * (rows * cols // 2)
+
+    # One frame per placed slot: [occupancy bitmask (bit r * cols + c),
+    # next choice to try: 0 = horizontal, 1 = vertical, 2 = exhausted]
+    stack = [[0, 0]]
+    while stack:
+        frame = stack[-1]
+        occ = frame[0]
+        empty = full & ~occ
+        if not empty:
+            return tuple(slots)
+
+        # First empty cell in row-major order is the lowest clear bit
+        idx = (empty & -empty).bit_length() - 1
+        r, c = divmod(idx, cols)
+        cell = 1 << idx
+        depth = len(stack) - 1
+
+        # Try horizontal
+        if frame[1] == 0:
+            frame[1] = 1
+            right = cell << 1
+            if c + 1 < cols and not occ & right:
+                slots[depth] = (r, c, Orientation.HORIZONTAL)
+                stack.append([occ | cell | right, 0])
+                continue
+
+        # Try vertical
+        if frame[1] == 1:
+            frame[1] = 2
+            below = cell << cols
+            if r + 1 < rows and not occ & below:
+                slots[depth] = (r, c, Orientation.VERTICAL)
+                stack.append([occ | cell | below, 0])
+                continue
+
+        # First empty cell must be filled, so back up if we couldn't place
+        stack.pop()
+
+    return None
+
+
 def place_dominoes_on_grid(
     dominoes: List[Domino],
     rows: int,
     cols: int
 ) -> Optional[List[PlacedDomino]]:
     """
-    Place dominoes on grid using backtracking.
+    Place dominoes on grid, one per slot of the grid's tiling.
     Returns a valid placement or None.
     """
-    total_cells = rows * cols
-    if len(dominoes) * 2 != total_cells:
+    if len(dominoes) * 2 != rows * cols:
         return None
 
-    placements: List[PlacedDomino] = []
-    occupied: Set[Tuple[int, int]] = set()
-
-    def backtrack(domino_idx: int) -> bool:
-        if domino_idx == len(dominoes):
-            return True
-
-        domino = dominoes[domino_idx]
-
-        # Find first empty cell
-        for r in range(rows):
-            for c in range(cols):
-                if (r, c) in occupied:
-                    continue
+    # Any domino fits any slot, so the tiling only depends on the grid shape
+    slots = _tile_grid(rows, cols)
+    if slots is None:
+        return None
+    return [PlacedDomino(d, r, c, orient) for d, (r, c, orient) in zip(dominoes, slots)]
 
-                # Try horizontal
-                if c + 1 < cols and (r, c + 1) not in occupied:
-                    occupied.add((r, c))
-                    occupied.add((r, c + 1))
-                    placements.append(PlacedDomino(domino, r, c, Orientation.HORIZONTAL))
 
-                    if backtrack(domino_idx + 1):
-                        return True
+@lru_cache(maxsize=None)
+def _slot_pairs(rows: int, cols: int) -> Optional[Tuple[Tuple[int, int], ...]]:
+    """Flat grid indices of the (low, high) cells of each tiling slot."""
+    slots = _tile_grid(rows, cols)
+    if slots is None:
+        return None
+    return tuple(
+        (r * cols + c, r * cols + c + (1 if orient == Orientation.HORIZONTAL else cols))
+        for r, c, orient in slots
+    )
 
-                    occupied.remove((r, c))
-                    occupied.remove((r, c + 1))
-                    placements.pop()
 
-                # Try vertical
-                if r + 1 < rows and (r + 1, c) not in occupied:
-                    occupied.add((r, c))
-                    occupied.add((r + 1, c))
-                    placements.append(PlacedDomino(domino, r, c, Orientation.VERTICAL))
+def _slot_pip_grid(dominoes: Sequence[Domino], pairs: Sequence[Tuple[int, int]], size: int) -> array:
+    """
+    Lay the pip values of dominoes placed on flat cell pairs out row-major,
+    one byte per cell. Cells not covered by any domino hold -1.
+    """
+    grid = array('b', [-1]) * size
+    for d, (i, j) in zip(dominoes, pairs):
+        grid[i] = d.low
+        grid[j] = d.high
+    return grid
 
-                    if backtrack(domino_idx + 1):
-                        return True
 
-                    occupied.remove((r, c))
-                    occupied.remove((r + 1, c))
-                    placements.pop()
+@lru_cache(maxsize=None)
+def _flat_region_indices(
+    region_cells: Tuple[Tuple[Tuple[int, int], ...], ...],
+    cols: int
+) -> Tuple[Tuple[int, ...], ...]:
+    """Grid indices of each region's cells; layouts repeat across attempts."""
+    return tuple(tuple(r * cols + c for r, c in cells) for cells in region_cells)
 
-                # First empty cell must be filled, so return if we couldn't place
-                return False
 
-        return False
+@lru_cache(maxsize=None)
+def _region_owners(
+    region_cells: Tuple[Tuple[Tuple[int, int], ...], ...],
+    size: int,
+    cols: int
+) -> Optional[Tuple[int, ...]]:
+    """
+    Flat grid index -> region index table. Cells in no region map to
+    len(region_cells). None if regions overlap or reach outside the grid.
+    """
+    spare = len(region_cells)
+    owners = [spare] * size
+    for i, indices in enumerate(_flat_region_indices(region_cells, cols)):
+        for j in indices:
+            if not 0 <= j < size or owners[j] != spare:
+                return None
+            owners[j] = i
+    return tuple(owners)
+
+
+def compute_region_sums(
+    grid: array,
+    cols: int,
+    region_cells: Sequence[Sequence[Tuple[int, int]]]
+) -> List[int]:
+    """Compute the pip sum of every region from a _slot_pip_grid grid."""
+    if not isinstance(region_cells, tuple):
+        region_cells = tuple(tuple(cells) for cells in region_cells)
+    owners = _region_owners(region_cells, len(grid), cols)
+    if owners is None:
+        at = grid.__getitem__
+        return [sum(map(at, indices)) for indices in _flat_region_indices(region_cells, cols)]
+
+    # One pass over the grid, scattering each cell into its region's sum
+    sums = [0] * (len(region_cells) + 1)
+    for owner, pips in zip(owners, grid):
+        sums[owner] += pips
+    sums.pop()  # Cells in no region
+    return sums
+
+
+# (cells, constraint type, target value, linked region id) of one region
+RegionKey = Tuple[Tuple[Tuple[int, int], ...], ConstraintType, Optional[int], Optional[int]]
+
+
+@lru_cache(maxsize=None)
+def _cell_owners(
+    region_cells: Tuple[Tuple[Tuple[int, int], ...], ...],
+    rows: int,
+    cols: int
+) -> Optional[Tuple[int, ...]]:
+    """Region index of each grid cell, or None unless the regions tile the grid."""
+    owners = _region_owners(region_cells, rows * cols, cols)
+    if owners is None or len(region_cells) in owners:
+        return None
+    return owners
 
-    if backtrack(0):
-        return placements
-    return None
 
+def _has_twin_solution(
+    dominoes: Sequence[Domino],
+    pairs: Sequence[Tuple[int, int]],
+    owners: Optional[Tuple[int, ...]],
+    region_keys: Sequence[RegionKey],
+    sums: List[int]
+) -> bool:
+    """
+    Check whether the placement is a solution with a mirror-image twin.
+    If the placement meets every constraint and some non-double lies wholly
+    inside one region, flipping it leaves every region sum unchanged, so the
+    puzzle has at least two solutions without running the solver.
+    """
+    if owners is None:
+        return False  # Regions don't tile the grid; leave it to the solver
 
-def get_cell_pip_value(placements: List[PlacedDomino], cell: Tuple[int, int]) -> int:
-    """Get the pip value at a specific cell from placements."""
-    r, c = cell
-    for p in placements:
-        if p.orientation == Orientation.HORIZONTAL:
-            if (p.row, p.col) == cell:
-                return p.domino.low
-            if (p.row, p.col + 1) == cell:
-                return p.domino.high
+    for i, (_, ctype, target, linked) in enumerate(region_keys):
+        if ctype == ConstraintType.SUM:
+            ok = sums[i] == target
+        elif ctype == ConstraintType.LESS:
+            ok = linked is not None and linked < len(sums) and sums[i] < sums[linked]
+        elif ctype == ConstraintType.GREATER:
+            ok = linked is not None and linked < len(sums) and sums[i] > sums[linked]
         else:
-            if (p.row, p.col) == cell:
-                return p.domino.low
-            if (p.row + 1, p.col) == cell:
-                return p.domino.high
-    return -1
+            return False
+        if not ok:
+            return False
 
+    for d, (i, j) in zip(dominoes, pairs):
+        if d.low != d.high and owners[i] == owners[j]:
+            return True
+    return False
 
-def compute_region_sum(placements: List[PlacedDomino], cells: List[Tuple[int, int]]) -> int:
-    """Compute sum of pip values in region cells."""
-    return sum(get_cell_pip_value(placements, c) for c in cells)
+
+# Both caches are bounded: a long search visits far more distinct layouts and
+# region keys than ever repeat, and each worker process keeps its own copy
+@lru_cache(maxsize=256)
+def _layout_solver(
+    rows: int,
+    cols: int,
+    layout: Tuple[Tuple[Tuple[Tuple[int, int], ...], ConstraintType, Optional[int]], ...]
+) -> Solver:
+    """One Solver per (cells, type, linked region) layout, reused via reset()."""
+    regions = [Region(i, cells, ctype, linked_region_id=linked)
+               for i, (cells, ctype, linked) in enumerate(layout)]
+    puzzle = Puzzle(name="", difficulty="unknown", rows=rows, cols=cols,
+                    regions=regions, supply=DominoSet())
+    return Solver(puzzle, max_solutions=3)
+
+
+@lru_cache(maxsize=4096)
+def _count_solutions(domino_codes: bytes, rows: int, cols: int,
+                     region_keys: Tuple[RegionKey, ...]) -> int:
+    """
+    Solution count (capped at 3) for a puzzle given in key form.
+    The cap makes the count independent of supply order, so callers pass
+    the packed codes sorted and reordered supplies share one entry.
+    """
+    solver = _layout_solver(rows, cols, tuple(
+        (cells, ctype, linked) for cells, ctype, _, linked in region_keys))
+    solver.reset([Domino.from_code(code) for code in domino_codes],
+                 [target for _, _, target, _ in region_keys])
+    return solver.solve()
 
 
 def try_constraint_config(
     dominoes: List[Domino],
     rows: int,
     cols: int,
-    region_cells: List[List[Tuple[int, int]]],
-    constraint_types: List[ConstraintType],
+    region_cells: Sequence[Sequence[Tuple[int, int]]],
+    constraint_types: Sequence[ConstraintType],
     stats: GenerationStats,
     name: str = "Puzzle"
 ) -> Optional[Puzzle]:
@@ -120,47 +269,52 @@ def try_constraint_config(
     Try a specific constraint configuration.
     For SUM constraints, derives target from a valid placement.
     """
-    # First, find a valid placement
-    placement = place_dominoes_on_grid(dominoes, rows, cols)
-    if not placement:
+    # First, find a valid placement. Work from the grid's slots directly;
+    # PlacedDomino, Region and Puzzle objects are only built for a winner.
+    if len(dominoes) * 2 != rows * cols:
+        return None
+    pairs = _slot_pairs(rows, cols)
+    if not pairs:
         return None
 
-    # Build regions from the placement
-    regions = []
+    # Derive each region's constraint from the placement
+    if not isinstance(region_cells, tuple):
+        region_cells = tuple(tuple(cells) for cells in region_cells)
+    grid = _slot_pip_grid(dominoes, pairs, rows * cols)
+    sums = compute_region_sums(grid, cols, region_cells)
+    region_keys = []
     for i, (cells, ctype) in enumerate(zip(region_cells, constraint_types)):
-        region = Region(
-            id=i,
-            cells=cells,
-            constraint_type=ctype,
-        )
-
+        target = linked = None
         if ctype == ConstraintType.SUM:
-            region.target_value = compute_region_sum(placement, cells)
+            target = sums[i]
         elif ctype == ConstraintType.LESS:
-            region.linked_region_id = i + 1  # Link to next region
+            linked = i + 1  # Link to next region
         elif ctype == ConstraintType.GREATER:
-            region.linked_region_id = i + 1
-
-        regions.append(region)
+            linked = i + 1
+        region_keys.append((tuple(cells), ctype, target, linked))
+    region_keys = tuple(region_keys)
 
     stats.attempts += 1
 
-    puzzle = Puzzle(
-        name=name,
-        difficulty="unknown",
-        rows=rows,
-        cols=cols,
-        regions=regions,
-        supply=DominoSet(dominoes),
-        solution=placement
-    )
+    owners = _cell_owners(region_cells, rows, cols)
+    if _has_twin_solution(dominoes, pairs, owners, region_keys, sums):
+        stats.multiple_solutions += 1
+        return None
 
-    solver = Solver(puzzle, max_solutions=3)
-    count = solver.solve()
+    # Equal supplies and regions recur when a shuffle yields the same targets
+    count = _count_solutions(bytes(sorted(d.code for d in dominoes)), rows, cols, region_keys)
 
     if count == 1:
         stats.unique_found += 1
-        return puzzle
+        return Puzzle(
+            name=name,
+            difficulty="unknown",
+            rows=rows,
+            cols=cols,
+            regions=[Region(i, *key) for i, key in enumerate(region_keys)],
+            supply=DominoSet(dominoes),
+            solution=place_dominoes_on_grid(dominoes, rows, cols)
+        )
     elif count == 0:
         stats.no_solution += 1
     else:
@@ -169,227 +323,265 @@ def try_constraint_config(
     return None
 
 
-def search_for_unique_easy(stats: GenerationStats) -> Optional[Puzzle]:
-    """Search for an easy puzzle with unique solution (4 dominoes)."""
+Cell = Tuple[int, int]
+
+
+@dataclass(frozen=True, slots=True)
+class RegionConfig:
+    """A fixed region layout and the constraint type of each region."""
+    cells: Tuple[Tuple[Cell, ...], ...]
+    types: Tuple[ConstraintType, ...]
+
+
+ALL_D6: Tuple[Domino, ...] = tuple(DominoSet.double_six().dominoes)
+D9_REMAINDER: Tuple[Domino, ...] = tuple(DominoSet.double_nine_remainder().dominoes)
+
+# 2x4 grid, 8 cells = 4 dominoes
+EASY_REGION_CONFIGS: Tuple[RegionConfig, ...] = (
+    # Config 1: Two 4-cell regions (left/right split)
+    RegionConfig(
+        cells=(
+            ((0, 0), (0, 1), (1, 0), (1, 1)),
+            ((0, 2), (0, 3), (1, 2), (1, 3)),
+        ),
+        types=(ConstraintType.SUM, ConstraintType.SUM),
+    ),
+    # Config 2: Two 4-cell regions (top/bottom split)
+    RegionConfig(
+        cells=(
+            ((0, 0), (0, 1), (0, 2), (0, 3)),
+            ((1, 0), (1, 1), (1, 2), (1, 3)),
+        ),
+        types=(ConstraintType.SUM, ConstraintType.SUM),
+    ),
+    # Config 3: Inequality chain (4 regions of 2)
+    RegionConfig(
+        cells=(
+            ((0, 0), (0, 1)),
+            ((0, 2), (0, 3)),
+            ((1, 0), (1, 1)),
+            ((1, 2), (1, 3)),
+        ),
+        types=(ConstraintType.LESS, ConstraintType.LESS, ConstraintType.LESS, ConstraintType.SUM),
+    ),
+    # Config 4: Mixed - 2 EQUAL + 1 SUM (forces doubles)
+    RegionConfig(
+        cells=(
+            ((0, 0), (0, 1)),
+            ((0, 2), (0, 3)),
+            ((1, 0), (1, 1), (1, 2), (1, 3)),
+        ),
+        types=(ConstraintType.LESS, ConstraintType.SUM, ConstraintType.SUM),
+    ),
+    # Config 5: 3-cell regions (forces spanning)
+    RegionConfig(
+        cells=(
+            ((0, 0), (0, 1), (1, 0)),
+            ((0, 2), (0, 3), (1, 3)),
+            ((1, 1), (1, 2)),
+        ),
+        types=(ConstraintType.SUM, ConstraintType.SUM, ConstraintType.SUM),
+    ),
+)
+
+# 3x4 grid, 12 cells = 6 dominoes
+MEDIUM_REGION_CONFIGS: Tuple[RegionConfig, ...] = (
+    # Config 1: 4 regions with interesting shapes
+    RegionConfig(
+        cells=(
+            ((0, 0), (0, 1), (1, 0)),  # L-shape
+            ((0, 2), (0, 3), (1, 3)),  # reversed L
+            ((1, 1), (1, 2), (2, 1), (2, 2)),  # square
+            ((2, 0), (2, 3)),  # corners
+        ),
+        types=(ConstraintType.SUM, ConstraintType.SUM, ConstraintType.SUM, ConstraintType.SUM),
+    ),
+    # Config 2: Inequality chain
+    RegionConfig(
+        cells=(
+            ((0, 0), (0, 1), (0, 2), (0, 3)),
+            ((1, 0), (1, 1), (1, 2), (1, 3)),
+            ((2, 0), (2, 1), (2, 2), (2, 3)),
+        ),
+        types=(ConstraintType.LESS, ConstraintType.LESS, ConstraintType.SUM),
+    ),
+    # Config 3: 6 regions (one per domino with tight sums)
+    RegionConfig(
+        cells=(
+            ((0, 0), (0, 1)),
+            ((0, 2), (0, 3)),
+            ((1, 0), (1, 1)),
+            ((1, 2), (1, 3)),
+            ((2, 0), (2, 1)),
+            ((2, 2), (2, 3)),
+        ),
+        types=(
+            ConstraintType.LESS, ConstraintType.LESS, ConstraintType.LESS,
+            ConstraintType.LESS, ConstraintType.LESS, ConstraintType.SUM
+        ),
+    ),
+)
+
+# 4x4 grid, 16 cells = 8 dominoes
+HARD_REGION_CONFIGS: Tuple[RegionConfig, ...] = (
+    # Config 1: Quadrants with inequality
+    RegionConfig(
+        cells=(
+            ((0, 0), (0, 1), (1, 0), (1, 1)),
+            ((0, 2), (0, 3), (1, 2), (1, 3)),
+            ((2, 0), (2, 1), (3, 0), (3, 1)),
+            ((2, 2), (2, 3), (3, 2), (3, 3)),
+        ),
+        types=(ConstraintType.LESS, ConstraintType.LESS, ConstraintType.LESS, ConstraintType.SUM),
+    ),
+    # Config 2: Horizontal strips
+    RegionConfig(
+        cells=(
+            ((0, 0), (0, 1), (0, 2), (0, 3)),
+            ((1, 0), (1, 1), (1, 2), (1, 3)),
+            ((2, 0), (2, 1), (2, 2), (2, 3)),
+            ((3, 0), (3, 1), (3, 2), (3, 3)),
+        ),
+        types=(ConstraintType.LESS, ConstraintType.LESS, ConstraintType.LESS, ConstraintType.SUM),
+    ),
+)
+
+
+# One combo's worth of work: the (domino order, config) pairs to try in turn
+ComboTask = Tuple[int, int, str, Tuple[Tuple[Tuple[Domino, ...], RegionConfig], ...]]
+
+
+def _try_combo(task: ComboTask) -> Tuple[Optional[Puzzle], GenerationStats]:
+    """Run a combo's attempts until one yields a unique puzzle."""
+    rows, cols, name, attempts = task
+    stats = GenerationStats()
+    for dominoes, config in attempts:
+        puzzle = try_constraint_config(
+            list(dominoes), rows, cols,
+            config.cells, config.types,
+            stats, name
+        )
+        if puzzle:
+            return puzzle, stats
+    return None, stats
 
-    # Double-six dominoes to try
-    all_d6 = [
-        Domino(0, 0), Domino(0, 1), Domino(0, 2), Domino(0, 3),
-        Domino(0, 4), Domino(0, 5), Domino(0, 6), Domino(1, 1),
-        Domino(1, 2), Domino(1, 3), Domino(1, 4), Domino(1, 5),
-        Domino(1, 6), Domino(2, 2), Domino(2, 3), Domino(2, 4),
-        Domino(2, 5), Domino(2, 6), Domino(3, 3), Domino(3, 4),
-        Domino(3, 5), Domino(3, 6), Domino(4, 4), Domino(4, 5),
-        Domino(4, 6), Domino(5, 5), Domino(5, 6), Domino(6, 6),
-    ]
 
-    rows, cols = 2, 4  # 8 cells = 4 dominoes
+def _try_batch(batch: List[ComboTask]) -> List[Tuple[Optional[Puzzle], GenerationStats]]:
+    """Run combos in order, stopping after the first unique puzzle. Pool worker."""
+    results = []
+    for task in batch:
+        results.append(_try_combo(task))
+        if results[-1][0]:
+            break
+    return results
 
-    # Different region configurations to try
-    region_configs = [
-        # Config 1: Two 4-cell regions (left/right split)
-        {
-            "cells": [
-                [(0, 0), (0, 1), (1, 0), (1, 1)],
-                [(0, 2), (0, 3), (1, 2), (1, 3)],
-            ],
-            "types": [ConstraintType.SUM, ConstraintType.SUM],
-        },
-        # Config 2: Two 4-cell regions (top/bottom split)
-        {
-            "cells": [
-                [(0, 0), (0, 1), (0, 2), (0, 3)],
-                [(1, 0), (1, 1), (1, 2), (1, 3)],
-            ],
-            "types": [ConstraintType.SUM, ConstraintType.SUM],
-        },
-        # Config 3: Inequality chain (4 regions of 2)
-        {
-            "cells": [
-                [(0, 0), (0, 1)],
-                [(0, 2), (0, 3)],
-                [(1, 0), (1, 1)],
-                [(1, 2), (1, 3)],
-            ],
-            "types": [ConstraintType.LESS, ConstraintType.LESS, ConstraintType.LESS, ConstraintType.SUM],
-        },
-        # Config 4: Mixed - 2 EQUAL + 1 SUM (forces doubles)
-        {
-            "cells": [
-                [(0, 0), (0, 1)],
-                [(0, 2), (0, 3)],
-                [(1, 0), (1, 1), (1, 2), (1, 3)],
-            ],
-            "types": [ConstraintType.LESS, ConstraintType.SUM, ConstraintType.SUM],
-        },
-        # Config 5: 3-cell regions (forces spanning)
-        {
-            "cells": [
-                [(0, 0), (0, 1), (1, 0)],
-                [(0, 2), (0, 3), (1, 3)],
-                [(1, 1), (1, 2)],
-            ],
-            "types": [ConstraintType.SUM, ConstraintType.SUM, ConstraintType.SUM],
-        },
-    ]
 
-    # Try different domino combinations
-    for combo in itertools.combinations(all_d6, 4):
-        dominoes = list(combo)
+# Combos per submitted batch, and how many batches to keep in flight
+BATCH_SIZE = 64
+MAX_IN_FLIGHT = 2 * (os.cpu_count() or 1)
 
-        for config in region_configs:
-            puzzle = try_constraint_config(
-                dominoes, rows, cols,
-                config["cells"], config["types"],
-                stats, "Easy Puzzle"
-            )
-            if puzzle:
-                return puzzle
 
-            # Also try with shuffled domino order
-            random.shuffle(dominoes)
-            puzzle = try_constraint_config(
-                dominoes, rows, cols,
-                config["cells"], config["types"],
-                stats, "Easy Puzzle"
-            )
+def _parallel_results(
+    executor: Executor,
+    tasks: Iterable[ComboTask]
+) -> Iterator[Tuple[Optional[Puzzle], GenerationStats]]:
+    """
+    Yield _try_combo results in task order while workers run ahead on a
+    bounded window of batches. Batches still queued when the caller stops
+    are cancelled, so an abandoned search doesn't hold up the next one.
+    """
+    tasks = iter(tasks)
+
+    def submit_next() -> None:
+        batch = list(itertools.islice(tasks, BATCH_SIZE))
+        if batch:
+            pending.append(executor.submit(_try_batch, batch))
+
+    pending: Deque[Future] = deque()
+    try:
+        for _ in range(MAX_IN_FLIGHT):
+            submit_next()
+        while pending:
+            results = pending.popleft().result()
+            submit_next()
+            yield from results
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _run_combos(
+    tasks: Iterable[ComboTask],
+    stats: GenerationStats,
+    max_attempts: int,
+    executor: Optional[Executor] = None
+) -> Optional[Puzzle]:
+    """
+    Try combos in order until one yields a unique puzzle or the attempt
+    budget runs out. With an executor, combos are solved in parallel but
+    results are consumed in order, so the outcome matches the serial search.
+    """
+    if executor is None:
+        results = (_try_combo(task) for task in tasks)
+    else:
+        results = _parallel_results(executor, tasks)
+    with closing(results):
+        for puzzle, combo_stats in results:
+            stats.attempts += combo_stats.attempts
+            stats.unique_found += combo_stats.unique_found
+            stats.no_solution += combo_stats.no_solution
+            stats.multiple_solutions += combo_stats.multiple_solutions
             if puzzle:
                 return puzzle
-
-        if stats.attempts > 50000:
-            break
-
+            if stats.attempts > max_attempts:
+                break
     return None
 
 
-def search_for_unique_medium(stats: GenerationStats) -> Optional[Puzzle]:
-    """Search for a medium puzzle with unique solution (6 dominoes)."""
-
-    all_d6 = [
-        Domino(0, 0), Domino(0, 1), Domino(0, 2), Domino(0, 3),
-        Domino(0, 4), Domino(0, 5), Domino(0, 6), Domino(1, 1),
-        Domino(1, 2), Domino(1, 3), Domino(1, 4), Domino(1, 5),
-        Domino(1, 6), Domino(2, 2), Domino(2, 3), Domino(2, 4),
-        Domino(2, 5), Domino(2, 6), Domino(3, 3), Domino(3, 4),
-        Domino(3, 5), Domino(3, 6), Domino(4, 4), Domino(4, 5),
-        Domino(4, 6), Domino(5, 5), Domino(5, 6), Domino(6, 6),
-    ]
-
-    rows, cols = 3, 4  # 12 cells = 6 dominoes
+def _easy_tasks() -> Iterator[ComboTask]:
+    rows, cols = 2, 4  # 8 cells = 4 dominoes
 
-    region_configs = [
-        # Config 1: 4 regions with interesting shapes
-        {
-            "cells": [
-                [(0, 0), (0, 1), (1, 0)],  # L-shape
-                [(0, 2), (0, 3), (1, 3)],  # reversed L
-                [(1, 1), (1, 2), (2, 1), (2, 2)],  # square
-                [(2, 0), (2, 3)],  # corners
-            ],
-            "types": [ConstraintType.SUM, ConstraintType.SUM, ConstraintType.SUM, ConstraintType.SUM],
-        },
-        # Config 2: Inequality chain
-        {
-            "cells": [
-                [(0, 0), (0, 1), (0, 2), (0, 3)],
-                [(1, 0), (1, 1), (1, 2), (1, 3)],
-                [(2, 0), (2, 1), (2, 2), (2, 3)],
-            ],
-            "types": [ConstraintType.LESS, ConstraintType.LESS, ConstraintType.SUM],
-        },
-        # Config 3: 6 regions (one per domino with tight sums)
-        {
-            "cells": [
-                [(0, 0), (0, 1)],
-                [(0, 2), (0, 3)],
-                [(1, 0), (1, 1)],
-                [(1, 2), (1, 3)],
-                [(2, 0), (2, 1)],
-                [(2, 2), (2, 3)],
-            ],
-            "types": [
-                ConstraintType.LESS, ConstraintType.LESS, ConstraintType.LESS,
-                ConstraintType.LESS, ConstraintType.LESS, ConstraintType.SUM
-            ],
-        },
-    ]
-
-    for combo in itertools.combinations(all_d6, 6):
+    # Try different domino combinations
+    for combo in itertools.combinations(ALL_D6, 4):
         dominoes = list(combo)
+        attempts = []
 
-        for config in region_configs:
-            puzzle = try_constraint_config(
-                dominoes, rows, cols,
-                config["cells"], config["types"],
-                stats, "Medium Puzzle"
-            )
-            if puzzle:
-                return puzzle
-
-        if stats.attempts > 50000:
-            break
-
-    return None
+        for config in EASY_REGION_CONFIGS:
+            attempts.append((tuple(dominoes), config))
 
+            # Also try with shuffled domino order. The order fixes the
+            # placement, so a shuffle that changed nothing can be skipped.
+            tried = tuple(dominoes)
+            random.shuffle(dominoes)
+            if tuple(dominoes) != tried:
+                attempts.append((tuple(dominoes), config))
 
-def search_for_unique_hard(stats: GenerationStats) -> Optional[Puzzle]:
-    """Search for a hard puzzle with unique solution (8 dominoes from double-nine remainder)."""
+        yield rows, cols, "Easy Puzzle", tuple(attempts)
 
-    # Double-nine remainder: tiles with at least one side >= 7
-    d9_remainder = [
-        Domino(0, 7), Domino(0, 8), Domino(0, 9),
-        Domino(1, 7), Domino(1, 8), Domino(1, 9),
-        Domino(2, 7), Domino(2, 8), Domino(2, 9),
-        Domino(3, 7), Domino(3, 8), Domino(3, 9),
-        Domino(4, 7), Domino(4, 8), Domino(4, 9),
-        Domino(5, 7), Domino(5, 8), Domino(5, 9),
-        Domino(6, 7), Domino(6, 8), Domino(6, 9),
-        Domino(7, 7), Domino(7, 8), Domino(7, 9),
-        Domino(8, 8), Domino(8, 9),
-        Domino(9, 9),
-    ]
 
-    rows, cols = 4, 4  # 16 cells = 8 dominoes
+def search_for_unique_easy(stats: GenerationStats, executor: Optional[Executor] = None) -> Optional[Puzzle]:
+    """Search for an easy puzzle with unique solution (4 dominoes)."""
+    return _run_combos(_easy_tasks(), stats, 50000, executor)
 
-    region_configs = [
-        # Config 1: Quadrants with inequality
-        {
-            "cells": [
-                [(0, 0), (0, 1), (1, 0), (1, 1)],
-                [(0, 2), (0, 3), (1, 2), (1, 3)],
-                [(2, 0), (2, 1), (3, 0), (3, 1)],
-                [(2, 2), (2, 3), (3, 2), (3, 3)],
-            ],
-            "types": [ConstraintType.LESS, ConstraintType.LESS, ConstraintType.LESS, ConstraintType.SUM],
-        },
-        # Config 2: Horizontal strips
-        {
-            "cells": [
-                [(0, 0), (0, 1), (0, 2), (0, 3)],
-                [(1, 0), (1, 1), (1, 2), (1, 3)],
-                [(2, 0), (2, 1), (2, 2), (2, 3)],
-                [(3, 0), (3, 1), (3, 2), (3, 3)],
-            ],
-            "types": [ConstraintType.LESS, ConstraintType.LESS, ConstraintType.LESS, ConstraintType.SUM],
-        },
-    ]
-
-    for combo in itertools.combinations(d9_remainder, 8):
-        dominoes = list(combo)
 
-        for config in region_configs:
-            puzzle = try_constraint_config(
-                dominoes, rows, cols,
-                config["cells"], config["types"],
-                stats, "Hard Puzzle"
-            )
-            if puzzle:
-                return puzzle
+def search_for_unique_medium(stats: GenerationStats, executor: Optional[Executor] = None) -> Optional[Puzzle]:
+    """Search for a medium puzzle with unique solution (6 dominoes)."""
+    rows, cols = 3, 4  # 12 cells = 6 dominoes
+    tasks = (
+        (rows, cols, "Medium Puzzle", tuple((combo, config) for config in MEDIUM_REGION_CONFIGS))
+        for combo in itertools.combinations(ALL_D6, 6)
+    )
+    return _run_combos(tasks, stats, 50000, executor)
 
-        if stats.attempts > 100000:
-            break
 
-    return None
+def search_for_unique_hard(stats: GenerationStats, executor: Optional[Executor] = None) -> Optional[Puzzle]:
+    """Search for a hard puzzle with unique solution (8 dominoes from double-nine remainder)."""
+    rows, cols = 4, 4  # 16 cells = 8 dominoes
+    tasks = (
+        (rows, cols, "Hard Puzzle", tuple((combo, config) for config in HARD_REGION_CONFIGS))
+        for combo in itertools.combinations(D9_REMAINDER, 8)
+    )
+    return _run_combos(tasks, stats, 100000, executor)
 
 
 if __name__ == "__main__":
@@ -397,10 +589,13 @@ if __name__ == "__main__":
     print("PUZZLE GENERATION - SEARCHING FOR UNIQUE SOLUTIONS")
     print("=" * 60)
 
+    # Attempts are independent, so spread each search's combos across cores
+    executor = ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+
     # Easy puzzle
     print("\n--- EASY (4 dominoes, 2x4 grid) ---")
     easy_stats = GenerationStats()
-    easy_puzzle = search_for_unique_easy(easy_stats)
+    easy_puzzle = search_for_unique_easy(easy_stats, executor)
 
     if easy_puzzle:
         print(f"✓ Found unique puzzle after {easy_stats.attempts} attempts!")
@@ -421,7 +616,7 @@ if __name__ == "__main__":
     # Medium puzzle
     print("\n--- MEDIUM (6 dominoes, 3x4 grid) ---")
     medium_stats = GenerationStats()
-    medium_puzzle = search_for_unique_medium(medium_stats)
+    medium_puzzle = search_for_unique_medium(medium_stats, executor)
 
     if medium_puzzle:
         print(f"✓ Found unique puzzle after {medium_stats.attempts} attempts!")
@@ -433,7 +628,7 @@ if __name__ == "__main__":
     # Hard puzzle
     print("\n--- HARD (8 dominoes from double-nine remainder, 4x4 grid) ---")
     hard_stats = GenerationStats()
-    hard_puzzle = search_for_unique_hard(hard_stats)
+    hard_puzzle = search_for_unique_hard(hard_stats, executor)
 
     if hard_puzzle:
         print(f"✓ Found unique puzzle after {hard_stats.attempts} attempts!")
@@ -441,3 +636,5 @@ if __name__ == "__main__":
     else:
         print(f"✗ No unique puzzle found after {hard_stats.attempts} attempts")
         print(f"  (No solution: {hard_stats.no_solution}, Multiple: {hard_stats.multiple_solutions})")
+
+    executor.shutdown(cancel_futures=True)
@@ -15,20 +15,31 @@ class Orientation(Enum):
     VERTICAL = 'V'    # Domino spans (r,c) and (r+1,c)
 
 
-@dataclass
+# Int codes for hot loops; the Enums remain the public API
+HORIZONTAL_CODE, VERTICAL_CODE = 0, 1
+ORIENTATION_CODES = {Orientation.HORIZONTAL: HORIZONTAL_CODE, Orientation.VERTICAL: VERTICAL_CODE}
+
+
+@dataclass(slots=True)
 class PlacedDomino:
     """A domino placed on the grid."""
     domino: Domino
     row: int
     col: int
     orientation: Orientation
+    _orient_code: int = field(init=False, repr=False, compare=False)
+    _cells: Tuple[Tuple[int, int], Tuple[int, int]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._orient_code = ORIENTATION_CODES[self.orientation]
+        if self._orient_code == HORIZONTAL_CODE:
+            self._cells = ((self.row, self.col), (self.row, self.col + 1))
+        else:
+            self._cells = ((self.row, self.col), (self.row + 1, self.col))
 
     def cells(self) -> Tuple[Tuple[int, int], Tuple[int, int]]:
         """Return the two cells this domino occupies."""
-        if self.orientation == Orientation.HORIZONTAL:
-            return ((self.row, self.col), (self.row, self.col + 1))
-        else:
-            return ((self.row, self.col), (self.row + 1, self.col))
+        return self._cells
 
 
 class ConstraintType(Enum):
@@ -39,20 +50,36 @@ class ConstraintType(Enum):
     LESS = 'less'         # Sum < linked region's sum
 
 
-@dataclass
+SUM_CODE, EQUAL_CODE, UNEQUAL_CODE, GREATER_CODE, LESS_CODE = range(5)
+CONSTRAINT_CODES = {
+    ConstraintType.SUM: SUM_CODE,
+    ConstraintType.EQUAL: EQUAL_CODE,
+    ConstraintType.UNEQUAL: UNEQUAL_CODE,
+    ConstraintType.GREATER: GREATER_CODE,
+    ConstraintType.LESS: LESS_CODE,
+}
+
+
+@dataclass(slots=True)
 class Region:
     """A region in the puzzle grid with a constraint."""
     id: int
-    cells: List[Tuple[int, int]]
+    cells: Tuple[Tuple[int, int], ...]
     constraint_type: ConstraintType = ConstraintType.SUM
     target_value: Optional[int] = None  # For SUM constraint
     linked_region_id: Optional[int] = None  # For GREATER/LESS constraints
+    # Code for constraint_type; set at init, so don't reassign constraint_type
+    _ctype_code: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.cells = tuple(self.cells)  # Accept any iterable of cells
+        self._ctype_code = CONSTRAINT_CODES[self.constraint_type]
 
     def size(self) -> int:
         return len(self.cells)
 
 
-@dataclass
+@dataclass(slots=True)
 class Puzzle:
     """A complete puzzle definition."""
     name: str
@@ -62,13 +89,16 @@ class Puzzle:
     regions: List[Region]
     supply: DominoSet
     solution: List[PlacedDomino] = field(default_factory=list)
+    # cell -> region, built on first lookup; reset to None if regions change
+    _cell_to_region: Optional[Dict[Tuple[int, int], Region]] = field(
+        default=None, init=False, repr=False, compare=False)
 
     def get_cell_region(self, row: int, col: int) -> Optional[Region]:
         """Get the region containing a cell."""
-        for region in self.regions:
-            if (row, col) in region.cells:
-                return region
-        return None
+        if self._cell_to_region is None:
+            # Reversed so the first region listing a cell wins, as with a scan
+            self._cell_to_region = {cell: r for r in reversed(self.regions) for cell in r.cells}
+        return self._cell_to_region.get((row, col))
 
 
 class GridGenerator:
@@ -3,12 +3,26 @@ Parser for NYT Pips puzzle JSON format.
 Converts NYT format to our internal Puzzle format.
 """
 import json
-from typing import Dict, List, Optional, Tuple
+import multiprocessing
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from domino_sets import Domino, DominoSet
 from grid import Puzzle, Region, PlacedDomino, Orientation, ConstraintType
 
 
+# NYT region type -> (our ConstraintType, whether the region keeps its target).
+# Empty means no constraint - we use SUM with None target
+_CONSTRAINT_MAP: Dict[str, Tuple[ConstraintType, bool]] = {
+    "sum": (ConstraintType.SUM, True),
+    "equals": (ConstraintType.EQUAL, True),
+    "unequal": (ConstraintType.UNEQUAL, True),
+    "empty": (ConstraintType.SUM, False),
+    "less": (ConstraintType.LESS, True),
+    "greater": (ConstraintType.GREATER, True),
+}
+_DEFAULT_CONSTRAINT = (ConstraintType.SUM, True)  # Unknown types
+
+
 def parse_nyt_puzzle(nyt_data: dict, difficulty: str = "easy") -> Puzzle:
     """
     Parse NYT Pips puzzle JSON into our Puzzle format.
@@ -23,86 +37,50 @@ def parse_nyt_puzzle(nyt_data: dict, difficulty: str = "easy") -> Puzzle:
     # Handle full response vs single puzzle
     if difficulty in nyt_data:
         puzzle_data = nyt_data[difficulty]
-        print_date = nyt_data.get("printDate", "unknown")
     else:
         puzzle_data = nyt_data
-        print_date = puzzle_data.get("printDate", "unknown")
+    return _parse_one(puzzle_data, nyt_data.get("printDate", "unknown"), difficulty)
+
 
+def _parse_one(puzzle_data: dict, print_date: str, difficulty: str) -> Puzzle:
+    """Parse a single NYT puzzle dict; print_date comes from the enclosing response."""
     # Parse dominoes
-    dominoes = []
-    for d in puzzle_data["dominoes"]:
-        low, high = sorted(d)  # Ensure low <= high
-        dominoes.append(Domino(low, high))
+    dominoes = [Domino.canonical(a, b) for a, b in puzzle_data["dominoes"]]  # Ensure low <= high
 
     # Parse regions
+    # Grid dimensions are tracked while walking the cells
     regions = []
+    max_row = max_col = 0
+    get_constraint = _CONSTRAINT_MAP.get
     for i, r in enumerate(puzzle_data["regions"]):
-        cells = [tuple(idx) for idx in r["indices"]]  # Convert to (row, col) tuples
-        region_type = r["type"]
-        target = r.get("target")
-
-        # Map NYT types to our ConstraintType
-        if region_type == "sum":
-            constraint = ConstraintType.SUM
-        elif region_type == "equals":
-            constraint = ConstraintType.EQUAL
-        elif region_type == "unequal":
-            constraint = ConstraintType.UNEQUAL
-        elif region_type == "empty":
-            # Empty means no constraint - we'll use SUM with None target
-            constraint = ConstraintType.SUM
-            target = None
-        elif region_type == "less":
-            constraint = ConstraintType.LESS
-        elif region_type == "greater":
-            constraint = ConstraintType.GREATER
-        else:
-            constraint = ConstraintType.SUM
-
+        cells = []
+        for row, col in r["indices"]:  # Convert to (row, col) tuples
+            if row >= max_row:
+                max_row = row + 1
+            if col >= max_col:
+                max_col = col + 1
+            cells.append((row, col))
+        constraint, has_target = get_constraint(r["type"], _DEFAULT_CONSTRAINT)
         regions.append(Region(
             id=i,
             cells=cells,
             constraint_type=constraint,
-            target_value=target
+            target_value=r.get("target") if has_target else None
         ))
 
-    # Calculate grid dimensions from all cells
-    all_cells = []
-    for region in regions:
-        all_cells.extend(region.cells)
-
-    if all_cells:
-        max_row = max(c[0] for c in all_cells) + 1
-        max_col = max(c[1] for c in all_cells) + 1
-    else:
-        max_row, max_col = 0, 0
-
     # Parse solution
     solution = []
-    for i, placement in enumerate(puzzle_data.get("solution", [])):
-        if i >= len(dominoes):
-            break
-
-        cell1 = tuple(placement[0])  # (row, col)
-        cell2 = tuple(placement[1])  # (row, col)
-
-        # Determine orientation
-        if cell1[0] == cell2[0]:  # Same row = horizontal
-            orientation = Orientation.HORIZONTAL
-            # Ensure left-to-right order
-            if cell1[1] > cell2[1]:
-                cell1, cell2 = cell2, cell1
-            row, col = cell1
-        else:  # Same column = vertical
-            orientation = Orientation.VERTICAL
-            # Ensure top-to-bottom order
-            if cell1[0] > cell2[0]:
-                cell1, cell2 = cell2, cell1
-            row, col = cell1
-
-        # Figure out which end of domino goes where
-        # The solution array order matches dominoes array
-        domino = dominoes[i]
+    horizontal, vertical = Orientation.HORIZONTAL, Orientation.VERTICAL
+    # The solution array order matches dominoes array; zip stops at the shorter
+    for placement, domino in zip(puzzle_data.get("solution", ()), dominoes):
+        r1, c1 = placement[0]  # (row, col)
+        r2, c2 = placement[1]  # (row, col)
+
+        # Same row = horizontal. The cells are adjacent, so the anchor
+        # (left/top cell) is the min on each axis
+        orientation = horizontal if r1 == r2 else vertical
+        row = r1 if r1 <= r2 else r2
+        col = c1 if c1 <= c2 else c2
 
         solution.append(PlacedDomino(
             domino=domino,
@@ -133,27 +111,46 @@ def parse_nyt_json_file(filepath: str) -> Dict[str, Puzzle]:
     Returns:
         Dict with keys "easy", "medium", "hard" -> Puzzle objects
     """
-    with open(filepath, 'r') as f:
-        data = json.load(f)
-
-    puzzles = {}
-    for difficulty in ["easy", "medium", "hard"]:
-        if difficulty in data:
-            puzzles[difficulty] = parse_nyt_puzzle(data, difficulty)
-
-    return puzzles
+    # json.loads takes bytes directly, skipping the text-mode decode layer
+    with open(filepath, 'rb') as f:
+        return _parse_all(json.loads(f.read()))
 
 
 def parse_nyt_json_string(json_str: str) -> Dict[str, Puzzle]:
     """
     Parse NYT JSON from a string and return all puzzles.
     """
-    data = json.loads(json_str)
+    return _parse_all(json.loads(json_str))
+
+
+def _parse_path(filepath: str) -> Tuple[str, Dict[str, Puzzle]]:
+    """Pool worker: parse one file, tagging the result with its path."""
+    return filepath, parse_nyt_json_file(filepath)
+
+
+def parse_many(filepaths: Sequence[str], processes: Optional[int] = None) -> Dict[str, Dict[str, Puzzle]]:
+    """
+    Parse many saved NYT JSON files (e.g. an archive) across worker processes.
+
+    Returns:
+        Dict of filepath -> {"easy"/"medium"/"hard" -> Puzzle}, in input order
+    """
+    results = {}
+    with multiprocessing.get_context("spawn").Pool(processes) as pool:
+        for filepath, puzzles in pool.imap_unordered(_parse_path, filepaths, chunksize=8):
+            results[filepath] = puzzles
+    return {filepath: results[filepath] for filepath in filepaths}
+
+
+def _parse_all(data: dict) -> Dict[str, Puzzle]:
+    """Parse every difficulty present in a full NYT response."""
+    print_date = data.get("printDate", "unknown")
 
     puzzles = {}
-    for difficulty in ["easy", "medium", "hard"]:
-        if difficulty in data:
-            puzzles[difficulty] = parse_nyt_puzzle(data, difficulty)
+    for difficulty in ("easy", "medium", "hard"):
+        puzzle_data = data.get(difficulty)
+        if puzzle_data is not None:
+            puzzles[difficulty] = _parse_one(puzzle_data, print_date, difficulty)
 
     return puzzles
 
@@ -13,18 +13,113 @@ To get your NYT-S cookie:
 3. Find the NYT-S cookie and copy its value
 """
 
-import argparse
 import json
-import requests
+import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+from functools import cache
+from typing import Optional
 
 
-def fetch_pips_puzzle(date_str: str, nyt_s_cookie: str) -> dict:
+# Common prefixes of embedded game data; each ends where the JSON object starts
+_EXTRACT_PATTERNS = [re.compile(p, re.DOTALL) for p in (
+    r'window\.gameData\s*=\s*(?=\{)',
+    r'"puzzle"\s*:\s*(?=\{)',
+    r'"pipsData"\s*:\s*(?=\{)',
+    r'__NEXT_DATA__.*?"props":\s*(?=\{)',
+)]
+_JSON_DECODER = json.JSONDecoder()
+_SCRIPT_RE = re.compile(r'<script[^>]*>([^<]+)</script>')
+_JSON_INNER_RE = re.compile(r'(\{[^}]+("cells"|"regions"|"dominos")[^}]+\})')
+
+log = logging.getLogger(__name__)
+
+_API_HEADERS = {'Accept': 'application/json'}
+
+
+@cache
+def _session():
+    """
+    One session for every request, so the connection and TLS session to
+    www.nytimes.com are reused instead of renegotiated per endpoint.
+    requests is imported here so HTML-only callers never pay for it.
+    """
+    import requests
+
+    session = requests.Session()
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+    })
+    return session
+
+
+def _load_cache(cache_path: str) -> dict:
+    """Load the on-disk response cache; a missing or unreadable file is empty."""
+    try:
+        with open(cache_path, 'rb') as f:
+            return json.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache_path: str, entries: dict) -> None:
+    """Write the response cache, replacing the old file atomically."""
+    tmp_path = cache_path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(entries, f)
+    os.replace(tmp_path, cache_path)
+
+
+def fetch_pips_puzzle(date_str: str, nyt_s_cookie: str, cache_path: Optional[str] = None) -> dict:
     """
     Fetch Pips puzzle data for a specific date.
 
     Tries several possible endpoint patterns based on NYT API conventions.
+    With cache_path, responses are kept on disk by date along with their
+    ETag/Last-Modified, and a repeat fetch first revalidates the cached copy
+    with a conditional GET; a 304 returns it without re-downloading. If
+    revalidation and every endpoint fail, the cached copy is returned.
     """
+    cookies = {'NYT-S': nyt_s_cookie}
+    session = _session()
+    disk_cache = _load_cache(cache_path) if cache_path else {}
+
+    def remember(endpoint, response, data):
+        if cache_path:
+            disk_cache[date_str] = {
+                'endpoint': endpoint,
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'data': data,
+            }
+            _save_cache(cache_path, disk_cache)
+        return data
+
+    entry = disk_cache.get(date_str)
+    if entry:
+        endpoint = entry['endpoint']
+        headers = dict(_API_HEADERS)
+        if entry['etag']:
+            headers['If-None-Match'] = entry['etag']
+        if entry['last_modified']:
+            headers['If-Modified-Since'] = entry['last_modified']
+        try:
+            log.debug("Revalidating cached: %s", endpoint)
+            response = session.get(endpoint, headers=headers, cookies=cookies, timeout=10)
+
+            if response.status_code == 304:
+                log.info("  Not modified, using cached copy")
+                return entry['data']
+            elif response.status_code == 200:
+                log.info("  Success! Status: %s", response.status_code)
+                return remember(endpoint, response, json.loads(response.content))
+            else:
+                log.debug("  Status: %s", response.status_code)
+        except Exception as e:
+            log.debug("  Error: %s", e)
+
     # Possible API endpoints (based on other NYT games patterns)
     endpoints = [
         f"https://www.nytimes.com/svc/games/pips/v2/{date_str}.json",
@@ -33,25 +128,38 @@ def fetch_pips_puzzle(date_str: str, nyt_s_cookie: str) -> dict:
         f"https://www.nytimes.com/games-assets/pips/{date_str}.json",
     ]
 
-    headers = {
-        'Cookie': f'NYT-S={nyt_s_cookie};',
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-        'Accept': 'application/json',
-    }
-
-    for endpoint in endpoints:
-        try:
-            print(f"Trying: {endpoint}")
-            response = requests.get(endpoint, headers=headers, timeout=10)
-
-            if response.status_code == 200:
-                print(f"  Success! Status: {response.status_code}")
-                return response.json()
-            else:
-                print(f"  Status: {response.status_code}")
-        except Exception as e:
-            print(f"  Error: {e}")
-
+    # Probe every endpoint at once and take the first 200, so dead endpoints
+    # cost one timeout in total rather than one each
+    executor = ThreadPoolExecutor(max_workers=len(endpoints))
+    try:
+        futures = {}
+        for endpoint in endpoints:
+            log.debug("Trying: %s", endpoint)
+            future = executor.submit(session.get, endpoint, headers=_API_HEADERS,
+                                     cookies=cookies, timeout=10)
+            futures[future] = endpoint
+
+        for future in as_completed(futures):
+            endpoint = futures[future]
+            try:
+                response = future.result()
+
+                if response.status_code == 200:
+                    log.info("  %s: Success! Status: %s", endpoint, response.status_code)
+                    # Parse the raw body bytes; skips building the decoded response.text
+                    return remember(endpoint, response, json.loads(response.content))
+                else:
+                    log.debug("  %s: Status: %s", endpoint, response.status_code)
+            except Exception as e:
+                log.debug("  %s: Error: %s", endpoint, e)
+    finally:
+        # Don't wait on probes still in flight once we have an answer
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    # Nothing answered (e.g. offline): a stale cached copy beats no puzzle
+    if entry:
+        log.info("  Revalidation failed, using cached copy")
+        return entry['data']
     return None
 
 
@@ -61,22 +169,17 @@ def fetch_game_page(date_str: str, nyt_s_cookie: str) -> str:
     """
     url = f"https://www.nytimes.com/games/pips?d={date_str}"
 
-    headers = {
-        'Cookie': f'NYT-S={nyt_s_cookie};',
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-    }
-
     try:
-        print(f"Fetching game page: {url}")
-        response = requests.get(url, headers=headers, timeout=30)
+        log.debug("Fetching game page: %s", url)
+        response = _session().get(url, cookies={'NYT-S': nyt_s_cookie}, timeout=30)
 
         if response.status_code == 200:
-            print(f"  Got {len(response.text)} characters")
+            log.info("  Got %d characters", len(response.text))
             return response.text
         else:
-            print(f"  Status: {response.status_code}")
+            log.info("  Status: %s", response.status_code)
     except Exception as e:
-        print(f"  Error: {e}")
+        log.info("  Error: %s", e)
 
     return None
 
@@ -86,22 +189,13 @@ def extract_puzzle_from_html(html: str) -> dict:
     Extract puzzle data from embedded JavaScript/JSON in the page.
     Look for common patterns like window.gameData, __NEXT_DATA__, etc.
     """
-    import re
-
-    # Common patterns for embedded game data
-    patterns = [
-        r'window\.gameData\s*=\s*(\{.*?\});',
-        r'"puzzle"\s*:\s*(\{.*?\})',
-        r'"pipsData"\s*:\s*(\{.*?\})',
-        r'__NEXT_DATA__.*?"props":\s*(\{.*?\})\s*<',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, html, re.DOTALL)
+    for pattern in _EXTRACT_PATTERNS:
+        match = pattern.search(html)
         if match:
             try:
-                data = json.loads(match.group(1))
-                print(f"  Found data with pattern: {pattern[:30]}...")
+                # Decode exactly one object from the prefix, nested braces and all
+                data, _ = _JSON_DECODER.raw_decode(html, match.end())
+                log.debug("  Found data with pattern: %s...", pattern.pattern[:30])
                 return data
             except json.JSONDecodeError:
                 continue
@@ -110,11 +204,11 @@ def extract_puzzle_from_html(html: str) -> dict:
     puzzle_indicators = ['cells', 'regions', 'dominos', 'constraints', 'tiles']
 
     # Look for script tags with JSON
-    script_match = re.findall(r'<script[^>]*>([^<]+)</script>', html)
+    script_match = _SCRIPT_RE.findall(html)
     for script in script_match:
         if any(ind in script.lower() for ind in puzzle_indicators):
             # Try to extract JSON
-            json_match = re.search(r'(\{[^}]+("cells"|"regions"|"dominos")[^}]+\})', script)
+            json_match = _JSON_INNER_RE.search(script)
             if json_match:
                 try:
                     return json.loads(json_match.group(1))
@@ -168,12 +262,19 @@ def convert_to_our_format(nyt_data: dict) -> dict:
 
 
 def main():
+    import argparse
+
     parser = argparse.ArgumentParser(description='Fetch NYT Pips puzzles')
     parser.add_argument('--cookie', required=True, help='NYT-S cookie value')
     parser.add_argument('--date', default=None, help='Date in YYYY-MM-DD format (default: yesterday)')
     parser.add_argument('--output', default='puzzle.json', help='Output file')
+    parser.add_argument('--cache', default='nyt_cache.json',
+                        help='Response cache file, revalidated with ETag/Last-Modified (default: nyt_cache.json)')
+    parser.add_argument('--no-cache', action='store_true', help='Always download, ignoring the cache')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Log every endpoint and pattern tried')
 
     args = parser.parse_args()
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO, format='%(message)s')
 
     if args.date:
         date_str = args.date
@@ -187,7 +288,7 @@ def main():
 
     # Try direct API first
     print("--- Trying Direct API ---")
-    puzzle_data = fetch_pips_puzzle(date_str, args.cookie)
+    puzzle_data = fetch_pips_puzzle(date_str, args.cookie, None if args.no_cache else args.cache)
 
     if puzzle_data:
         print(f"\nSuccess! Saving to {args.output}")
@@ -2,7 +2,7 @@
 PDF renderer for domino puzzles using fpdf2.
 Styled to match NYT Pips visual design.
 """
-from typing import List, Dict, Tuple, Optional, Set
+from typing import Callable, List, Dict, Tuple, Optional, Set
 from fpdf import FPDF
 import math
 
@@ -10,6 +10,57 @@ from domino_sets import Domino, DominoSet
 from grid import Puzzle, Region, PlacedDomino, Orientation, ConstraintType
 
 
+def _unit_arc(start: float, sweep: float, steps: int,
+              endpoint: bool = True) -> Tuple[Tuple[float, float], ...]:
+    """(cos, sin) at steps even angles from start across sweep radians."""
+    count = steps + 1 if endpoint else steps
+    return tuple((math.cos(start + sweep * (i / steps)), math.sin(start + sweep * (i / steps)))
+                 for i in range(count))
+
+
+def _color_op(color: Tuple[int, int, int], operator: str) -> str:
+    """A raw PDF color operator ("rg" fill, "RG" stroke) for an RGB tuple."""
+    r, g, b = color
+    return f"{r / 255:.3f} {g / 255:.3f} {b / 255:.3f} {operator}"
+
+
+def _circle_path(cx: float, cy: float, r: float) -> str:
+    """
+    A closed circle subpath in PDF units: the same four Bezier curves
+    pdf.ellipse emits, without a paint operator.
+    """
+    k = 4 / 3 * (math.sqrt(2) - 1) * r
+    left, right, top, bottom = cx - r, cx + r, cy + r, cy - r
+    return (f"{right:.2f} {cy:.2f} m "
+            f"{right:.2f} {cy + k:.2f} {cx + k:.2f} {top:.2f} {cx:.2f} {top:.2f} c "
+            f"{cx - k:.2f} {top:.2f} {left:.2f} {cy + k:.2f} {left:.2f} {cy:.2f} c "
+            f"{left:.2f} {cy - k:.2f} {cx - k:.2f} {bottom:.2f} {cx:.2f} {bottom:.2f} c "
+            f"{cx + k:.2f} {bottom:.2f} {right:.2f} {cy - k:.2f} {right:.2f} {cy:.2f} c")
+
+
+def _dash_spans(length: float, dash_len: float, gap_len: float) -> List[Tuple[float, float]]:
+    """(start, end) distances of each dash along a line; the last is clipped."""
+    period = dash_len + gap_len
+    spans = []
+    for k in range(math.ceil(length / period)):
+        start = k * period
+        if start >= length:
+            break
+        spans.append((start, min(start + dash_len, length)))
+    return spans
+
+
+# Badge text for each constraint type; None means the region gets no badge
+# ("empty" regions are SUM with no target). Unknown types show "?"
+_BADGE_LABELS: Dict[ConstraintType, Callable[[Region], Optional[str]]] = {
+    ConstraintType.SUM: lambda region: None if region.target_value is None else str(region.target_value),
+    ConstraintType.EQUAL: lambda region: "=",
+    ConstraintType.LESS: lambda region: "<" if region.target_value is None else f"< {region.target_value}",
+    ConstraintType.GREATER: lambda region: ">",
+    ConstraintType.UNEQUAL: lambda region: "≠",
+}
+
+
 class PuzzleRenderer:
     """Renders puzzles to PDF in NYT Pips style."""
 
@@ -71,58 +122,108 @@ class PuzzleRenderer:
         9: [(0.25, 0.25), (0.5, 0.25), (0.75, 0.25), (0.25, 0.5), (0.5, 0.5), (0.75, 0.5), (0.25, 0.75), (0.5, 0.75), (0.75, 0.75)],
     }
 
+    # Unit arcs for rounded-rect corners (TL, TR, BR, BL), 6 segments each,
+    # and 3 each for small radii
+    _CORNER_ARCS = tuple(_unit_arc(start, math.pi / 2, 6)
+                         for start in (math.pi, 3 * math.pi / 2, 0, math.pi / 2))
+    _CORNER_ARCS_COARSE = tuple(_unit_arc(start, math.pi / 2, 3)
+                                for start in (math.pi, 3 * math.pi / 2, 0, math.pi / 2))
+
+    # Unit arcs for badge semicircles by edge, 16 segments; "circle" is the fallback
+    _BADGE_ARCS = {
+        "bottom": _unit_arc(0, -math.pi, 16),
+        "top": _unit_arc(math.pi, math.pi, 16),
+        "right": _unit_arc(math.pi / 2, -math.pi, 16),
+        "left": _unit_arc(-math.pi / 2, -math.pi, 16),
+        "circle": _unit_arc(0, 2 * math.pi, 16, endpoint=False),
+    }
+
     def __init__(self, puzzle: Puzzle):
         self.puzzle = puzzle
-        self.pdf = FPDF(orientation='P', unit='mm', format='letter')
-        self.pdf.set_auto_page_break(auto=False)
-        # Add Unicode font for special characters like ≠
-        import os
-        font_path = os.path.join(os.path.dirname(__file__), 'DejaVuSans-Bold.ttf')
-        if os.path.exists(font_path):
-            self.pdf.add_font('DejaVu', '', font_path)
-            self.unicode_font = 'DejaVu'
-        else:
-            self.unicode_font = None
+        self.pdf = self._new_pdf()
+        self._reset_graphics_state()
+
+        # Badge side cells by (region id, grid bounds); see _find_badge_position
+        self._badge_sides: Dict[Tuple, Tuple[Optional[Tuple[int, int]], ...]] = {}
+
+        # Pip offsets in mm by cell size, built on first use of each size
+        self._pip_cache: Dict[float, Dict[int, Tuple[Tuple[float, float], ...]]] = {}
+        # Pip glyph paths by (pip_count, cell_size, radius); see _pip_glyph
+        self._pip_glyphs: Dict[Tuple[int, float, float], str] = {}
+
+        # Every cell as a packed id, row << 16 | col
+        self._cell_ids = frozenset(r << 16 | c for region in puzzle.regions for r, c in region.cells)
+
+        # Region cells as parallel row and column tuples, so bounds and centroid
+        # queries are single min/max/sum calls rather than loops over cell tuples
+        self._region_rows: Dict[int, Tuple[int, ...]] = {}
+        self._region_cols: Dict[int, Tuple[int, ...]] = {}
+        # (min_row, min_col, max_row, max_col) per region id
+        self._region_bounds: Dict[int, Tuple[int, int, int, int]] = {}
+        for region in puzzle.regions:
+            if not region.cells:
+                continue
+            rows, cols = zip(*region.cells)
+            self._region_rows[region.id] = rows
+            self._region_cols[region.id] = cols
+            self._region_bounds[region.id] = (min(rows), min(cols), max(rows), max(cols))
+
+        # Fill color, border style (color, width, dash, gap) and badge color per
+        # region id, resolved once from the palettes
+        self._fill_colors: Dict[int, Tuple[int, int, int]] = {}
+        self._border_styles: Dict[int, Tuple[Tuple[int, int, int], float, float, float]] = {}
+        self._badge_colors: Dict[int, Tuple[int, int, int]] = {}
+        for region in puzzle.regions:
+            # Check if this is an unconstrained "empty" region
+            is_empty = (region.constraint_type == ConstraintType.SUM and
+                       region.target_value is None)
+            if is_empty:
+                # Disabled look - light gray, with a darker gray border
+                self._fill_colors[region.id] = (225, 220, 215)
+                self._border_styles[region.id] = ((140, 135, 130), 1.0, 1.5, 2.5)
+            else:
+                self._fill_colors[region.id] = self.REGION_COLORS[region.id % len(self.REGION_COLORS)]
+                # Thicker line for print visibility
+                self._border_styles[region.id] = (
+                    self.BORDER_COLORS[region.id % len(self.BORDER_COLORS)], 1.5, 3, 3)
+            self._badge_colors[region.id] = self.BADGE_COLORS[region.id % len(self.BADGE_COLORS)]
+
+    def _reset_graphics_state(self):
+        """Forget the tracked draw state; call whenever self.pdf is replaced."""
+        self._cur_draw = None
+        self._cur_fill = None
+        self._cur_line_width = None
+        self._cur_font = None
+        # Pip glyphs placed by _place_pips, by fill color, until _flush_pips
+        self._glyph_batch: Dict[Tuple[int, int, int], List[str]] = {}
+
+    # The setters below skip calls that wouldn't change anything, so repeated
+    # settings in drawing loops cost a tuple compare rather than fpdf's color
+    # conversion and font lookup
+
+    def _set_draw_color(self, r: int, g: int, b: int):
+        if (r, g, b) != self._cur_draw:
+            self._cur_draw = (r, g, b)
+            self.pdf.set_draw_color(r, g, b)
+
+    def _set_fill_color(self, r: int, g: int, b: int):
+        if (r, g, b) != self._cur_fill:
+            self._cur_fill = (r, g, b)
+            self.pdf.set_fill_color(r, g, b)
+
+    def _set_line_width(self, width: float):
+        if width != self._cur_line_width:
+            self._cur_line_width = width
+            self.pdf.set_line_width(width)
+
+    def _set_font(self, family: str, style: str, size: int):
+        if (family, style, size) != self._cur_font:
+            self._cur_font = (family, style, size)
+            self.pdf.set_font(family, style, size)
 
     def _draw_rounded_rect(self, x: float, y: float, w: float, h: float,
                            r: float, fill: bool = True, stroke: bool = True):
         """Draw a rectangle with rounded corners using arc segments."""
-        # Clamp radius to half the smallest dimension
-        r = min(r, w / 2, h / 2)
-
-        # Build path points for rounded rectangle
-        # Using polygon approximation for corners
-        points = []
-        steps = 6  # Segments per corner
-
-        # Top-left corner
-        for i in range(steps + 1):
-            angle = math.pi + (math.pi / 2) * (i / steps)
-            px = x + r + r * math.cos(angle)
-            py = y + r + r * math.sin(angle)
-            points.append((px, py))
-
-        # Top-right corner
-        for i in range(steps + 1):
-            angle = 3 * math.pi / 2 + (math.pi / 2) * (i / steps)
-            px = x + w - r + r * math.cos(angle)
-            py = y + r + r * math.sin(angle)
-            points.append((px, py))
-
-        # Bottom-right corner
-        for i in range(steps + 1):
-            angle = 0 + (math.pi / 2) * (i / steps)
-            px = x + w - r + r * math.cos(angle)
-            py = y + h - r + r * math.sin(angle)
-            points.append((px, py))
-
-        # Bottom-left corner
-        for i in range(steps + 1):
-            angle = math.pi / 2 + (math.pi / 2) * (i / steps)
-            px = x + r + r * math.cos(angle)
-            py = y + h - r + r * math.sin(angle)
-            points.append((px, py))
-
         style = ''
         if fill and stroke:
             style = 'DF'
@@ -131,41 +232,74 @@ class PuzzleRenderer:
         elif stroke:
             style = 'D'
 
+        # Clamp radius to half the smallest dimension
+        r = min(r, w / 2, h / 2)
+
+        # A corner this small is within a quarter mm of square: draw a plain rect
+        if r < 0.6:
+            self.pdf.rect(x, y, w, h, style=style)
+            return
+
+        # Build path points for rounded rectangle
+        # Using polygon approximation for corners; below 3mm, 3-segment corners
+        # stray under 0.1mm from the true arc, so half the points will do
+        tl, tr, br, bl = self._CORNER_ARCS if r >= 3 else self._CORNER_ARCS_COARSE
+        left, top = x + r, y + r
+        right, bottom = x + w - r, y + h - r
+        points = [(left + r * cos, top + r * sin) for cos, sin in tl]
+        points += [(right + r * cos, top + r * sin) for cos, sin in tr]
+        points += [(right + r * cos, bottom + r * sin) for cos, sin in br]
+        points += [(left + r * cos, bottom + r * sin) for cos, sin in bl]
+
         self.pdf.polygon(points, style=style)
 
-    def _draw_dashed_line(self, x1: float, y1: float, x2: float, y2: float,
-                          dash_len: float = 2.0, gap_len: float = 2.0):
-        """Draw a dashed line between two points."""
+    def _dash_segments(self, x1: float, y1: float, x2: float, y2: float,
+                       dash_len: float = 2.0, gap_len: float = 2.0) -> List[Tuple[float, float, float, float]]:
+        """Split a line into dash segments (sx, sy, ex, ey)."""
         dx = x2 - x1
         dy = y2 - y1
         length = math.sqrt(dx * dx + dy * dy)
         if length == 0:
-            return
+            return []
 
         # Normalize direction
         dx /= length
         dy /= length
 
-        pos = 0
-        drawing = True
-        while pos < length:
-            seg_len = dash_len if drawing else gap_len
-            end_pos = min(pos + seg_len, length)
+        return [(x1 + dx * start, y1 + dy * start, x1 + dx * end, y1 + dy * end)
+                for start, end in _dash_spans(length, dash_len, gap_len)]
 
-            if drawing:
-                sx = x1 + dx * pos
-                sy = y1 + dy * pos
-                ex = x1 + dx * end_pos
-                ey = y1 + dy * end_pos
-                self.pdf.line(sx, sy, ex, ey)
+    def _stroke_segments(self, segments: List[Tuple[float, float, float, float]]):
+        """
+        Stroke line segments as one path in the current draw color and width.
+        Emits the same m/l operators as pdf.line, but a single S for the lot.
+        """
+        if not segments:
+            return
+        k, h = self.pdf.k, self.pdf.h
+        self.pdf._out(" ".join(
+            f"{sx * k:.2f} {(h - sy) * k:.2f} m {ex * k:.2f} {(h - ey) * k:.2f} l"
+            for sx, sy, ex, ey in segments) + " S")
 
-            pos = end_pos
-            drawing = not drawing
+    def _fill_and_outline_cells(self, cells, x_start: float, y_start: float, cell_size: float):
+        """
+        Fill cells in the current fill color and outline each one in the
+        current draw color, as one path: a re per cell and a single B.
+        """
+        if not cells:
+            return
+        k, h = self.pdf.k, self.pdf.h
+        size = cell_size * k
+        self.pdf._out(" ".join(
+            f"{(x_start + c * cell_size) * k:.2f} {(h - y_start - r * cell_size) * k:.2f} "
+            f"{size:.2f} {-size:.2f} re"
+            for r, c in cells) + " B")
 
     def _draw_semicircle_badge(self, cx: float, cy: float, size: float,
                                color: Tuple[int, int, int], label: str,
                                edge: str = "bottom"):
         """Draw a semicircle badge with a rectangular tab that protrudes into the region.
+        The label is drawn in the current text color; draw_grid sets white.
 
         Args:
             edge: Which edge the badge abuts ("top", "bottom", "left", "right")
@@ -173,10 +307,9 @@ class PuzzleRenderer:
         radius = size / 2
         tab_width = size  # Full width to match circle diameter
         tab_depth = size / 7  # How far the tab goes into the region (scales with size)
-        steps = 16  # Smoothness of the arc
 
-        self.pdf.set_fill_color(*color)
-        self.pdf.set_draw_color(*color)
+        self._set_fill_color(*color)
+        self._set_draw_color(*color)
 
         points = []
 
@@ -192,11 +325,8 @@ class PuzzleRenderer:
             # Right edge to start of arc
             points.append((cx + radius, tab_bottom))
             # Semicircle arc (bottom half)
-            for i in range(steps + 1):
-                angle = 0 - math.pi * (i / steps)
-                px = cx + radius * math.cos(angle)
-                py = tab_bottom - radius * math.sin(angle)
-                points.append((px, py))
+            points += [(cx + radius * cos, tab_bottom - radius * sin)
+                       for cos, sin in self._BADGE_ARCS["bottom"]]
             # Left edge back to tab
             points.append((cx - radius, tab_bottom))
             points.append((cx - tab_width / 2, tab_bottom))
@@ -206,11 +336,8 @@ class PuzzleRenderer:
             tab_top = cy
             tab_bottom = cy + tab_depth
             # Semicircle arc (top half)
-            for i in range(steps + 1):
-                angle = math.pi + math.pi * (i / steps)
-                px = cx + radius * math.cos(angle)
-                py = tab_top + radius * math.sin(angle)
-                points.append((px, py))
+            points += [(cx + radius * cos, tab_top + radius * sin)
+                       for cos, sin in self._BADGE_ARCS["top"]]
             # Right edge down to tab
             points.append((cx + radius, tab_top))
             points.append((cx + tab_width / 2, tab_top))
@@ -231,11 +358,8 @@ class PuzzleRenderer:
             points.append((tab_right, cy + tab_width / 2))
             points.append((tab_right, cy + radius))
             # Semicircle arc (right half)
-            for i in range(steps + 1):
-                angle = math.pi / 2 - math.pi * (i / steps)
-                px = tab_right + radius * math.cos(angle)
-                py = cy + radius * math.sin(angle)
-                points.append((px, py))
+            points += [(tab_right + radius * cos, cy + radius * sin)
+                       for cos, sin in self._BADGE_ARCS["right"]]
             # Back to tab
             points.append((tab_right, cy - radius))
             points.append((tab_right, cy - tab_width / 2))
@@ -245,11 +369,8 @@ class PuzzleRenderer:
             tab_left = cx
             tab_right = cx + tab_depth
             # Semicircle arc (left half)
-            for i in range(steps + 1):
-                angle = -math.pi / 2 - math.pi * (i / steps)
-                px = tab_left + radius * math.cos(angle)
-                py = cy + radius * math.sin(angle)
-                points.append((px, py))
+            points += [(tab_left + radius * cos, cy + radius * sin)
+                       for cos, sin in self._BADGE_ARCS["left"]]
             # Down to tab
             points.append((tab_left, cy + radius))
             points.append((tab_left, cy + tab_width / 2))
@@ -261,27 +382,21 @@ class PuzzleRenderer:
 
         else:
             # Full circle fallback
-            for i in range(steps):
-                angle = 2 * math.pi * (i / steps)
-                px = cx + radius * math.cos(angle)
-                py = cy + radius * math.sin(angle)
-                points.append((px, py))
+            points += [(cx + radius * cos, cy + radius * sin)
+                       for cos, sin in self._BADGE_ARCS["circle"]]
 
         # Draw filled polygon
         self.pdf.polygon(points, style='F')
 
-        # Draw white text for contrast on colored backgrounds
-        self.pdf.set_text_color(255, 255, 255)
         font_size = max(7, int(size * 0.875))  # Scale font with badge size (25% larger)
         # Use Unicode font if available (for ≠ symbol), otherwise Helvetica
         if self.unicode_font:
-            self.pdf.set_font(self.unicode_font, '', font_size)
+            self._set_font(self.unicode_font, '', font_size)
         else:
-            self.pdf.set_font('Helvetica', 'B', font_size)
+            self._set_font('Helvetica', 'B', font_size)
 
         # Center text in the semicircle part
         text_w = self.pdf.get_string_width(label)
-        text_h = 4  # Approximate text height
 
         if edge == "bottom":
             text_cx = cx
@@ -298,21 +413,34 @@ class PuzzleRenderer:
         else:
             text_cx, text_cy = cx, cy
 
-        # Center the text properly
-        self.pdf.set_xy(text_cx - text_w / 2, text_cy - text_h / 2)
-        self.pdf.cell(text_w, text_h, label, align='C')
+        # Center the text properly: baseline 0.3 of the font size below text_cy,
+        # where a centered cell() would put it, without cell's layout pass
+        self.pdf.text(text_cx - text_w / 2, text_cy + 0.3 * self.pdf.font_size, label)
 
     def _get_region_bounds(self, region: Region) -> Tuple[float, float, float, float]:
         """Get bounding box of region cells (min_row, min_col, max_row, max_col)."""
-        rows = [c[0] for c in region.cells]
-        cols = [c[1] for c in region.cells]
-        return min(rows), min(cols), max(rows), max(cols)
+        return self._region_bounds[region.id]
+
+    def _grid_bounds(self) -> Optional[Tuple[int, int, int, int]]:
+        """Bounding box of all cells (min_row, min_col, max_row, max_col), or None if empty."""
+        bounds = self._region_bounds.values()
+        if not bounds:
+            return None
+        return (min(b[0] for b in bounds), min(b[1] for b in bounds),
+                max(b[2] for b in bounds), max(b[3] for b in bounds))
 
     def _find_badge_position(self, region: Region, x_start: float, y_start: float,
-                             cell_size: float, all_cells: Set[Tuple[int, int]],
-                             used_positions: List[Tuple[float, float]] = None) -> Tuple[float, float, str]:
+                             cell_size: float, all_cells: Set[int],
+                             used_positions: List[Tuple[float, float]] = None,
+                             grid_bounds: Optional[Tuple[int, int, int, int]] = None) -> Tuple[float, float, str]:
         """Find optimal position for region's constraint badge outside the grid.
 
+        Args:
+            all_cells: Packed ids (row << 16 | col) of every grid cell, so
+                neighbour checks are integer adds rather than new tuples
+            grid_bounds: (min_row, min_col, max_row, max_col) of all_cells; pass it
+                when placing several badges so it isn't recomputed per region
+
         Returns:
             (cx, cy, edge) - center position and which edge it abuts
         """
@@ -320,23 +448,21 @@ class PuzzleRenderer:
             used_positions = []
 
         # Get grid boundaries
-        grid_min_r = min(c[0] for c in all_cells)
-        grid_max_r = max(c[0] for c in all_cells)
-        grid_min_c = min(c[1] for c in all_cells)
-        grid_max_c = max(c[1] for c in all_cells)
-
-        region_cells = set(region.cells)
-
-        # Find region cells on each outer edge of the GRID
-        # These are cells where placing a badge outside won't overlap the grid
-        bottom_edge_cells = [(r, c) for (r, c) in region.cells
-                            if r == grid_max_r or (r + 1, c) not in all_cells]
-        right_edge_cells = [(r, c) for (r, c) in region.cells
-                           if c == grid_max_c or (r, c + 1) not in all_cells]
-        top_edge_cells = [(r, c) for (r, c) in region.cells
-                         if r == grid_min_r or (r - 1, c) not in all_cells]
-        left_edge_cells = [(r, c) for (r, c) in region.cells
-                          if c == grid_min_c or (r, c - 1) not in all_cells]
+        if grid_bounds is None:
+            grid_bounds = self._grid_bounds()
+
+        # The outward cells only depend on the grid layout, so for this
+        # renderer's own cells they are worked out once per region and reused
+        # by every draw_grid call, whatever its position or scale
+        if all_cells is self._cell_ids:
+            key = (region.id, grid_bounds)
+            sides = self._badge_sides.get(key)
+            if sides is None:
+                sides = self._badge_side_cells(region, all_cells, grid_bounds)
+                self._badge_sides[key] = sides
+        else:
+            sides = self._badge_side_cells(region, all_cells, grid_bounds)
+        bottom, right, top, left = sides
 
         # Try each edge in priority order, picking the one with least conflicts
         # badge_offset should match tab_depth (size/7) so badges are flush
@@ -345,62 +471,35 @@ class PuzzleRenderer:
         badge_offset = 2 * scale
         candidates = []
 
-        def calc_position(edge_cells, edge_type):
-            if not edge_cells:
-                return None
-
-            # Find contiguous groups of edge cells and pick the largest
-            # For simplicity, just pick the cell that's most "outward" on this edge
-            if edge_type == "bottom":
-                # Pick the cell with the highest row (most bottom)
-                best_cell = max(edge_cells, key=lambda c: (c[0], c[1]))
-                r, c = best_cell
-                cx = x_start + (c + 0.5) * cell_size
-                cy = y_start + (r + 1) * cell_size + badge_offset
-            elif edge_type == "right":
-                # Pick the cell with the highest column (most right)
-                best_cell = max(edge_cells, key=lambda c: (c[1], c[0]))
-                r, c = best_cell
-                cx = x_start + (c + 1) * cell_size + badge_offset
-                cy = y_start + (r + 0.5) * cell_size
-            elif edge_type == "top":
-                # Pick the cell with the lowest row (most top)
-                best_cell = min(edge_cells, key=lambda c: (c[0], -c[1]))
-                r, c = best_cell
-                cx = x_start + (c + 0.5) * cell_size
-                cy = y_start + r * cell_size - badge_offset
-            elif edge_type == "left":
-                # Pick the cell with the lowest column (most left)
-                best_cell = min(edge_cells, key=lambda c: (c[1], c[0]))
-                r, c = best_cell
-                cx = x_start + c * cell_size - badge_offset
-                cy = y_start + (r + 0.5) * cell_size
-            return (cx, cy, edge_type)
-
         # Add candidates in priority order: bottom, right, top, left
-        for edge_cells, edge_type in [(bottom_edge_cells, "bottom"),
-                                       (right_edge_cells, "right"),
-                                       (top_edge_cells, "top"),
-                                       (left_edge_cells, "left")]:
-            pos = calc_position(edge_cells, edge_type)
-            if pos:
-                candidates.append(pos)
+        if bottom is not None:
+            r, c = bottom
+            candidates.append((x_start + (c + 0.5) * cell_size,
+                               y_start + (r + 1) * cell_size + badge_offset, "bottom"))
+        if right is not None:
+            r, c = right
+            candidates.append((x_start + (c + 1) * cell_size + badge_offset,
+                               y_start + (r + 0.5) * cell_size, "right"))
+        if top is not None:
+            r, c = top
+            candidates.append((x_start + (c + 0.5) * cell_size,
+                               y_start + r * cell_size - badge_offset, "top"))
+        if left is not None:
+            r, c = left
+            candidates.append((x_start + c * cell_size - badge_offset,
+                               y_start + (r + 0.5) * cell_size, "left"))
 
         # If no candidates (interior region), use region's own boundary
         if not candidates:
             # Find the region's own edges (cells on region boundary)
-            min_r = min(r for r, _ in region.cells)
-            max_r = max(r for r, _ in region.cells)
-            min_c = min(c for _, c in region.cells)
-            max_c = max(c for _, c in region.cells)
+            min_r = self._region_bounds[region.id][0]
 
             # Top of region
-            top_cells = [(r, c) for r, c in region.cells if r == min_r]
-            # Bottom of region
-            bottom_cells = [(r, c) for r, c in region.cells if r == max_r]
+            top_cols = [c for r, c in zip(self._region_rows[region.id], self._region_cols[region.id])
+                        if r == min_r]
             # Use top edge, place badge above (may overlap grid but necessary)
-            if top_cells:
-                center_c = sum(c for _, c in top_cells) / len(top_cells)
+            if top_cols:
+                center_c = sum(top_cols) / len(top_cols)
                 cx = x_start + (center_c + 0.5) * cell_size
                 cy = y_start + min_r * cell_size - badge_offset
                 candidates.append((cx, cy, "top"))
@@ -416,24 +515,120 @@ class PuzzleRenderer:
         cy = y_start + center_r * cell_size - badge_offset
         return cx, cy, "top"
 
+    def _badge_side_cells(self, region: Region, all_cells: Set[int],
+                          grid_bounds: Tuple[int, int, int, int]) -> Tuple[Optional[Tuple[int, int]], ...]:
+        """
+        The region's preferred (row, col) cell on the grid's bottom, right,
+        top and left outer edges, or None for a side it doesn't reach.
+        """
+        grid_min_r, grid_min_c, grid_max_r, grid_max_c = grid_bounds
+
+        # Find the region cell most "outward" on each outer edge of the GRID,
+        # in one pass. Edge cells are where a badge outside won't overlap the grid.
+        # Each side keeps its best cell as one int whose ordering is that side's
+        # preference, so comparing candidates is a single int compare
+        bottom = right = top = left = None
+        row = 1 << 16  # Packed id step to the next row
+        for r, c in region.cells:
+            cell_id = r << 16 | c
+            if r == grid_max_r or cell_id + row not in all_cells:
+                # Highest row (most bottom), then highest column
+                if bottom is None or cell_id > bottom:
+                    bottom = cell_id
+            if c == grid_max_c or cell_id + 1 not in all_cells:
+                # Highest column (most right), then highest row
+                key = c << 16 | r
+                if right is None or key > right:
+                    right = key
+            if r == grid_min_r or cell_id - row not in all_cells:
+                # Lowest row (most top), then highest column
+                key = r << 16 | (0xFFFF - c)
+                if top is None or key < top:
+                    top = key
+            if c == grid_min_c or cell_id - 1 not in all_cells:
+                # Lowest column (most left), then lowest row
+                key = c << 16 | r
+                if left is None or key < left:
+                    left = key
+
+        # Decode each side's key back to (row, col)
+        if bottom is not None:
+            bottom = (bottom >> 16, bottom & 0xFFFF)
+        if right is not None:
+            right = (right & 0xFFFF, right >> 16)
+        if top is not None:
+            top = (top >> 16, 0xFFFF - (top & 0xFFFF))
+        if left is not None:
+            left = (left & 0xFFFF, left >> 16)
+
+        return bottom, right, top, left
+
+    def _scaled_pips(self, cell_size: float) -> Dict[int, Tuple[Tuple[float, float], ...]]:
+        """PIP_POSITIONS scaled to cell_size, as mm offsets from the cell corner."""
+        pips = self._pip_cache.get(cell_size)
+        if pips is None:
+            pips = {count: tuple((px * cell_size, py * cell_size) for px, py in positions)
+                    for count, positions in self.PIP_POSITIONS.items()}
+            self._pip_cache[cell_size] = pips
+        return pips
+
     def draw_pip(self, x: float, y: float, radius: float = 1.8, color: Tuple[int, int, int] = (40, 40, 40)):
         """Draw a single pip (filled circle)."""
-        self.pdf.set_fill_color(*color)
+        self._set_fill_color(*color)
         self.pdf.ellipse(x - radius, y - radius, radius * 2, radius * 2, style='F')
 
+    def _pip_glyph(self, pip_count: int, cell_size: float, radius: float) -> str:
+        """
+        The filled path of one cell's pips, in PDF units relative to the cell's
+        top-left corner. Built once per (pip_count, cell_size, radius); placing
+        it is then a translation rather than re-formatting every curve.
+        """
+        key = (pip_count, cell_size, radius)
+        glyph = self._pip_glyphs.get(key)
+        if glyph is None:
+            k = self.pdf.k
+            glyph = " ".join(_circle_path(ox * k, -oy * k, radius * k)
+                             for ox, oy in self._scaled_pips(cell_size).get(pip_count, ()))
+            self._pip_glyphs[key] = glyph
+        return glyph
+
+    def _place_pips(self, x: float, y: float, cell_size: float, pip_count: int,
+                    radius: float, color: Tuple[int, int, int]):
+        """Queue one cell's pips as its cached glyph, translated to (x, y)."""
+        glyph = self._pip_glyph(pip_count, cell_size, radius)
+        if glyph:
+            k = self.pdf.k
+            self._glyph_batch.setdefault(color, []).append(
+                f"q 1 0 0 1 {x * k:.2f} {(self.pdf.h - y) * k:.2f} cm {glyph} f Q")
+
+    def _flush_pips(self):
+        """
+        Fill all queued pip glyphs, by color. Each placed glyph is filled
+        inside its own q/Q, since the translation can't change partway
+        through a path.
+        """
+        for color, glyphs in self._glyph_batch.items():
+            self._set_fill_color(*color)
+            self.pdf._out("\n".join(glyphs))
+        self._glyph_batch = {}
+
     def draw_pips_in_cell(self, x: float, y: float, cell_size: float, pip_count: int,
                           color: Tuple[int, int, int] = (40, 40, 40)):
         """Draw pips for a value in a single cell (half of a domino)."""
         pip_radius = cell_size * 0.08
-        for px, py in self.PIP_POSITIONS.get(pip_count, []):
-            pip_x = x + px * cell_size
-            pip_y = y + py * cell_size
-            self.draw_pip(pip_x, pip_y, pip_radius, color)
+        self._place_pips(x, y, cell_size, pip_count, pip_radius, color)
 
     def draw_domino_tile(self, x: float, y: float, domino: Domino,
                          horizontal: bool = True, cell_size: float = None,
                          with_shadow: bool = True):
         """Draw a domino tile in NYT style."""
+        self._queue_domino_tile(x, y, domino, horizontal, cell_size, with_shadow)
+        self._flush_pips()
+
+    def _queue_domino_tile(self, x: float, y: float, domino: Domino,
+                           horizontal: bool = True, cell_size: float = None,
+                           with_shadow: bool = True):
+        """Draw a domino tile's body and queue its pips for _flush_pips."""
         if cell_size is None:
             cell_size = self.CELL_SIZE * 0.8
 
@@ -446,18 +641,18 @@ class PuzzleRenderer:
 
         # Draw shadow
         if with_shadow:
-            self.pdf.set_fill_color(200, 200, 200)
+            self._set_fill_color(200, 200, 200)
             self._draw_rounded_rect(x + 1.5, y + 1.5, w, h, corner_r, fill=True, stroke=False)
 
         # Draw domino body (white with gray border)
-        self.pdf.set_fill_color(255, 255, 255)
-        self.pdf.set_draw_color(180, 180, 180)
-        self.pdf.set_line_width(0.8)
+        self._set_fill_color(255, 255, 255)
+        self._set_draw_color(180, 180, 180)
+        self._set_line_width(0.8)
         self._draw_rounded_rect(x, y, w, h, corner_r, fill=True, stroke=True)
 
         # Draw divider line
-        self.pdf.set_draw_color(180, 180, 180)
-        self.pdf.set_line_width(0.5)
+        self._set_draw_color(180, 180, 180)
+        self._set_line_width(0.5)
         if horizontal:
             self.pdf.line(x + cell_size, y + 3, x + cell_size, y + h - 3)
         else:
@@ -465,20 +660,13 @@ class PuzzleRenderer:
 
         # Draw pips on first half (low value)
         pip_radius = cell_size * 0.07
-        for px, py in self.PIP_POSITIONS.get(domino.low, []):
-            pip_x = x + px * cell_size
-            pip_y = y + py * cell_size
-            self.draw_pip(pip_x, pip_y, pip_radius)
+        self._place_pips(x, y, cell_size, domino.low, pip_radius, (40, 40, 40))
 
         # Draw pips on second half (high value)
-        for px, py in self.PIP_POSITIONS.get(domino.high, []):
-            if horizontal:
-                pip_x = x + cell_size + px * cell_size
-                pip_y = y + py * cell_size
-            else:
-                pip_x = x + px * cell_size
-                pip_y = y + cell_size + py * cell_size
-            self.draw_pip(pip_x, pip_y, pip_radius)
+        if horizontal:
+            self._place_pips(x + cell_size, y, cell_size, domino.high, pip_radius, (40, 40, 40))
+        else:
+            self._place_pips(x, y + cell_size, cell_size, domino.high, pip_radius, (40, 40, 40))
 
     def draw_grid(self, x_start: float, y_start: float, with_solution: bool = False,
                   label: str = None, scale: float = 1.0):
@@ -490,19 +678,11 @@ class PuzzleRenderer:
         """
         cell_size = self.CELL_SIZE * scale
 
-        # Build cell-to-region mapping
-        cell_region: Dict[Tuple[int, int], int] = {}
-        for region in self.puzzle.regions:
-            for cell in region.cells:
-                cell_region[cell] = region.id
-
         # Calculate grid bounds for outer background
-        all_cells = list(cell_region.keys())
-        if all_cells:
-            min_r = min(c[0] for c in all_cells)
-            max_r = max(c[0] for c in all_cells)
-            min_c = min(c[1] for c in all_cells)
-            max_c = max(c[1] for c in all_cells)
+        grid_bounds = self._grid_bounds()
+
+        if grid_bounds:
+            min_r, min_c, max_r, max_c = grid_bounds
 
             # Draw outer background (pinkish-beige)
             padding = 4
@@ -511,145 +691,103 @@ class PuzzleRenderer:
             bg_w = (max_c - min_c + 1) * cell_size + padding * 2
             bg_h = (max_r - min_r + 1) * cell_size + padding * 2
 
-            self.pdf.set_fill_color(235, 225, 220)  # Pinkish-beige
+            # Colors are set with raw operators inside q/Q, so the tracked
+            # graphics state still matches the page afterwards
+            self.pdf._out("q")
+            self.pdf._out(_color_op((235, 225, 220), "rg"))  # Pinkish-beige
             self._draw_rounded_rect(bg_x, bg_y, bg_w, bg_h, 6, fill=True, stroke=False)
+            self.pdf._out("Q")
 
             # Draw difficulty label in top-left corner if provided
             if label:
                 font_size = max(8, int(12 * scale))
-                self.pdf.set_font('Helvetica', 'B', font_size)
+                self._set_font('Helvetica', 'B', font_size)
                 self.pdf.set_text_color(180, 170, 165)  # Subtle color matching background
                 label_x = bg_x + 3 * scale
                 label_y = bg_y + 1 * scale
                 self.pdf.set_xy(label_x, label_y)
                 self.pdf.cell(0, 5 * scale, label)
 
-        # Draw region fills
+        # Draw region fills with the internal grid lines (thin solid grey for
+        # cell boundaries) in the same pass, so kids can see exactly where to
+        # place domino tiles. Each region is one path; a later region's outlines
+        # redraw any shared edge its fill covers
+        self.pdf._out("q")
+        self.pdf._out(_color_op((160, 160, 160), "RG"))  # Medium grey
+        self.pdf._out(f"{0.3 * scale * self.pdf.k:.2f} w")  # Thin but visible
         for region in self.puzzle.regions:
-            # Check if this is an unconstrained "empty" region
-            is_empty = (region.constraint_type == ConstraintType.SUM and
-                       region.target_value is None)
-
-            if is_empty:
-                # Disabled look - light gray
-                self.pdf.set_fill_color(225, 220, 215)
-            else:
-                color = self.REGION_COLORS[region.id % len(self.REGION_COLORS)]
-                self.pdf.set_fill_color(*color)
-
-            # Draw each cell
-            for (r, c) in region.cells:
-                x = x_start + c * cell_size
-                y = y_start + r * cell_size
-                self.pdf.rect(x, y, cell_size, cell_size, style='F')
-
-        # Draw internal grid lines (thin solid grey for cell boundaries)
-        # This ensures kids can see exactly where to place domino tiles
-        self.pdf.set_draw_color(160, 160, 160)  # Medium grey
-        self.pdf.set_line_width(0.3 * scale)  # Thin but visible
-        for (r, c) in cell_region.keys():
-            x = x_start + c * cell_size
-            y = y_start + r * cell_size
-            # Draw all four edges of every cell
-            self.pdf.rect(x, y, cell_size, cell_size, style='D')
-
-        # Collect all unique edges with their bordering regions
-        # Edge key: (x1, y1, x2, y2) normalized so (x1,y1) < (x2,y2)
-        edges: Dict[Tuple[float, float, float, float], List[int]] = {}
-
-        def get_region_border_info(region_id):
-            """Get border color and style for a region (print-optimized)."""
-            region = self.puzzle.regions[region_id]
-            is_empty = (region.constraint_type == ConstraintType.SUM and
-                       region.target_value is None)
-            if is_empty:
-                return (140, 135, 130), 1.0, 1.5, 2.5  # color, width, dash, gap (darker gray)
-            else:
-                color = self.BORDER_COLORS[region_id % len(self.BORDER_COLORS)]
-                return color, 1.5, 3, 3  # Thicker line for print visibility
+            self.pdf._out(_color_op(self._fill_colors[region.id], "rg"))
+            # Fill and outline all four edges of every cell
+            self._fill_and_outline_cells(region.cells, x_start, y_start, cell_size)
+        self.pdf._out("Q")
+
+        # Cell-to-region mapping as a flat row-major list, padded by one cell all
+        # round so every neighbour index is valid; -1 means no region there
+        if grid_bounds:
+            stride = max_c - min_c + 3
+            origin = 1 - min_r * stride - min_c + stride  # Flat index of cell (0, 0)
+            cell_region = [-1] * ((max_r - min_r + 3) * stride)
+            for region in self.puzzle.regions:
+                for r, c in region.cells:
+                    cell_region[origin + r * stride + c] = region.id
+
+        # Collect region borders as runs of unit edges, merged as they are found.
+        # One pass over the padded grid compares every slot with the one above it
+        # (a horizontal edge on grid line r) and the one to its left (a vertical
+        # edge on grid line c); the ids differ exactly where a border runs. Runs
+        # are grouped by (region pair, vertical, grid line), and the scan meets
+        # each group's edges in order along the line, so a run only ever needs
+        # extending at its end - no sort, no separate merge pass
+        edge_runs: Dict[Tuple[int, int, int, int], List[List[int]]] = {}
+        if grid_bounds:
+            for r in range(min_r, max_r + 2):
+                row_start = origin + r * stride
+                for c in range(min_c, max_c + 2):
+                    i = row_start + c
+                    here = cell_region[i]
+                    for other, vertical, line, pos in ((cell_region[i - stride], 0, r, c),
+                                                       (cell_region[i - 1], 1, c, r)):
+                        if other == here:
+                            continue
+                        key = (other, here, vertical, line) if other < here else (here, other, vertical, line)
+                        runs = edge_runs.get(key)
+                        if runs is None:
+                            edge_runs[key] = [[pos, pos + 1]]
+                        elif runs[-1][1] == pos:
+                            # Extend previous segment
+                            runs[-1][1] = pos + 1
+                        else:
+                            runs.append([pos, pos + 1])
+
+        # Convert runs to page coordinates; -1 (outside the grid) is no region
+        final_edges = []  # List of (x1, y1, x2, y2, region_ids)
+        for (rid1, rid2, vertical, line), runs in edge_runs.items():
+            region_ids = [rid2] if rid1 < 0 else [rid1, rid2]
+            for start, end in runs:
+                if vertical:
+                    x1 = x2 = x_start + line * cell_size
+                    y1, y2 = y_start + start * cell_size, y_start + end * cell_size
+                else:
+                    x1, x2 = x_start + start * cell_size, x_start + end * cell_size
+                    y1 = y2 = y_start + line * cell_size
+                final_edges.append((x1, y1, x2, y2, region_ids))
 
-        for region in self.puzzle.regions:
-            for (r, c) in region.cells:
-                x = x_start + c * cell_size
-                y = y_start + r * cell_size
-
-                # Check each edge
-                edge_defs = [
-                    ((r - 1, c), (x, y, x + cell_size, y)),          # Top
-                    ((r + 1, c), (x, y + cell_size, x + cell_size, y + cell_size)),  # Bottom
-                    ((r, c - 1), (x, y, x, y + cell_size)),          # Left
-                    ((r, c + 1), (x + cell_size, y, x + cell_size, y + cell_size)),  # Right
-                ]
-
-                for neighbor, (x1, y1, x2, y2) in edge_defs:
-                    if neighbor not in cell_region or cell_region[neighbor] != region.id:
-                        # Normalize edge key
-                        edge_key = (min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
-                        if edge_key not in edges:
-                            edges[edge_key] = []
-                        if region.id not in edges[edge_key]:
-                            edges[edge_key].append(region.id)
-
-        # Merge collinear edges that share the same region pair into longer segments
-        # Group by: (region_ids tuple, orientation, fixed coordinate)
-        def region_key(rids):
-            return tuple(sorted(rids))
-
-        merged_edges: Dict[Tuple, List[Tuple[float, float, float, float]]] = {}
-        for (x1, y1, x2, y2), region_ids in edges.items():
-            rkey = region_key(region_ids)
-            is_horizontal = (y1 == y2)
-            if is_horizontal:
-                group_key = (rkey, 'H', y1)
-            else:
-                group_key = (rkey, 'V', x1)
-            if group_key not in merged_edges:
-                merged_edges[group_key] = []
-            merged_edges[group_key].append((x1, y1, x2, y2))
+        border_info = self._border_styles
 
-        # For each group, merge contiguous segments
-        final_edges = []  # List of (x1, y1, x2, y2, region_ids)
-        for group_key, segs in merged_edges.items():
-            rkey, orientation, _ = group_key
-            region_ids = list(rkey)
-
-            if orientation == 'H':
-                # Sort by x coordinate, merge contiguous
-                segs.sort(key=lambda s: s[0])
-                merged = []
-                for seg in segs:
-                    if merged and abs(merged[-1][2] - seg[0]) < 0.01:
-                        # Extend previous segment
-                        merged[-1] = (merged[-1][0], merged[-1][1], seg[2], seg[3])
-                    else:
-                        merged.append(list(seg))
-                for seg in merged:
-                    final_edges.append((seg[0], seg[1], seg[2], seg[3], region_ids))
-            else:
-                # Sort by y coordinate, merge contiguous
-                segs.sort(key=lambda s: s[1])
-                merged = []
-                for seg in segs:
-                    if merged and abs(merged[-1][3] - seg[1]) < 0.01:
-                        # Extend previous segment
-                        merged[-1] = (merged[-1][0], merged[-1][1], seg[2], seg[3])
-                    else:
-                        merged.append(list(seg))
-                for seg in merged:
-                    final_edges.append((seg[0], seg[1], seg[2], seg[3], region_ids))
-
-        # Draw all edges with alternating colors for shared borders
+        # Draw all edges with alternating colors for shared borders.
+        # Dashes are bucketed by (color, width) and each bucket is stroked as
+        # one path, rather than one line operator and state change per dash
+        dash_buckets: Dict[Tuple[Tuple[int, int, int], float], List[Tuple[float, float, float, float]]] = {}
         for (x1, y1, x2, y2, region_ids) in final_edges:
             if len(region_ids) == 1:
                 # Single region border - draw full line
-                color, width, dash, gap = get_region_border_info(region_ids[0])
-                self.pdf.set_draw_color(*color)
-                self.pdf.set_line_width(width)
-                self._draw_dashed_line(x1, y1, x2, y2, dash, gap)
+                color, width, dash, gap = border_info[region_ids[0]]
+                dash_buckets.setdefault((color, width), []).extend(
+                    self._dash_segments(x1, y1, x2, y2, dash, gap))
             else:
                 # Shared border - alternating dashes in each region's color
-                color1, width1, dash1, _ = get_region_border_info(region_ids[0])
-                color2, width2, dash2, _ = get_region_border_info(region_ids[1])
+                color1, width1, dash1, _ = border_info[region_ids[0]]
+                color2, width2, dash2, _ = border_info[region_ids[1]]
 
                 # Use consistent dash length, no gaps (colors alternate instead)
                 dash_len = 3 * scale
@@ -663,31 +801,39 @@ class PuzzleRenderer:
                 dx /= length
                 dy /= length
 
-                pos = 0
-                color_idx = 0
-                colors = [color1, color2]
-                widths = [width1, width2]
-
-                while pos < length:
-                    end_pos = min(pos + dash_len, length)
-                    sx = x1 + dx * pos
-                    sy = y1 + dy * pos
-                    ex = x1 + dx * end_pos
-                    ey = y1 + dy * end_pos
-
-                    self.pdf.set_draw_color(*colors[color_idx])
-                    self.pdf.set_line_width(widths[color_idx])
-                    self.pdf.line(sx, sy, ex, ey)
-
-                    pos = end_pos
-                    color_idx = 1 - color_idx  # Alternate colors
+                targets = [dash_buckets.setdefault((color1, width1), []),
+                           dash_buckets.setdefault((color2, width2), [])]
+                # Line caps project half a width past each end, so neighbouring
+                # dashes overlap. The two colors are stroked separately (wider
+                # first, below), so a dash no wider than its neighbour stops
+                # short of where the neighbour's cap begins
+                overlap = (width1 + width2) / 2
+                trims = [overlap if width1 <= width2 else 0,
+                         overlap if width2 <= width1 else 0]
+
+                # Gapless dashes; even ones take the first color, odd the second
+                spans = _dash_spans(length, dash_len, 0)
+                for color_idx in (0, 1):
+                    trim = trims[color_idx]
+                    for start, end in spans[color_idx::2]:
+                        stop = end if end >= length else max(start, end - trim)
+                        targets[color_idx].append((x1 + dx * start, y1 + dy * start,
+                                                   x1 + dx * stop, y1 + dy * stop))
+
+        for (color, width), segments in sorted(dash_buckets.items(), key=lambda b: -b[0][1]):
+            self._set_draw_color(*color)
+            self._set_line_width(width)
+            self._stroke_segments(segments)
 
         # Draw placed dominoes if showing solution
         if with_solution and self.puzzle.solution:
+            # (x, y, pip) for every solution cell, queued after the outlines
+            pip_coords = []
             for placement in self.puzzle.solution:
                 cells = placement.cells()
                 r1, c1 = cells[0]
                 r2, c2 = cells[1]
+                domino = placement.domino
 
                 # Calculate domino bounding box
                 min_r, max_r = min(r1, r2), max(r1, r2)
@@ -700,14 +846,14 @@ class PuzzleRenderer:
 
                 # Draw domino outline (rounded rect with subtle border)
                 inset = 1.5 * scale
-                self.pdf.set_draw_color(120, 120, 120)
-                self.pdf.set_line_width(1.0 * scale)
+                self._set_draw_color(120, 120, 120)
+                self._set_line_width(1.0 * scale)
                 self._draw_rounded_rect(x + inset, y + inset, w - 2*inset, h - 2*inset,
                                        3 * scale, fill=False, stroke=True)
 
                 # Draw divider line between the two halves
-                self.pdf.set_draw_color(150, 150, 150)
-                self.pdf.set_line_width(0.5 * scale)
+                self._set_draw_color(150, 150, 150)
+                self._set_line_width(0.5 * scale)
                 if r1 == r2:  # Horizontal domino
                     mid_x = x + cell_size
                     self.pdf.line(mid_x, y + inset + 2*scale, mid_x, y + h - inset - 2*scale)
@@ -715,80 +861,98 @@ class PuzzleRenderer:
                     mid_y = y + cell_size
                     self.pdf.line(x + inset + 2*scale, mid_y, x + w - inset - 2*scale, mid_y)
 
-                # Draw pips
-                x1 = x_start + c1 * cell_size
-                y1 = y_start + r1 * cell_size
-                self.draw_pips_in_cell(x1, y1, cell_size, placement.domino.low)
+                pip_coords.append((x_start + c1 * cell_size, y_start + r1 * cell_size, domino.low))
+                pip_coords.append((x_start + c2 * cell_size, y_start + r2 * cell_size, domino.high))
+
+            # Draw pips
+            for px, py, pip in pip_coords:
+                self.draw_pips_in_cell(px, py, cell_size, pip)
 
-                x2 = x_start + c2 * cell_size
-                y2 = y_start + r2 * cell_size
-                self.draw_pips_in_cell(x2, y2, cell_size, placement.domino.high)
+            # Solution pips go down in one fill, above every tile outline
+            self._flush_pips()
 
         # Collect all badge info first (for collision detection)
-        all_cells_set = set(cell_region.keys())
         badge_size = 14 * scale
         badges = []  # List of (cx, cy, edge, color, label, region_id)
 
+        badge_labels = _BADGE_LABELS
+        badge_colors = self._badge_colors
+        find_badge_position = self._find_badge_position
+        cell_ids = self._cell_ids
+
         for region in self.puzzle.regions:
             # Format label based on constraint type
-            if region.constraint_type == ConstraintType.SUM:
-                if region.target_value is not None:
-                    label = str(region.target_value)
-                else:
-                    continue  # Skip "empty" regions with no constraint
-            elif region.constraint_type == ConstraintType.EQUAL:
-                label = "="
-            elif region.constraint_type == ConstraintType.LESS:
-                if region.target_value is not None:
-                    label = f"< {region.target_value}"
-                else:
-                    label = "<"
-            elif region.constraint_type == ConstraintType.GREATER:
-                label = ">"
-            elif region.constraint_type == ConstraintType.UNEQUAL:
-                label = "≠"
-            else:
-                label = "?"
+            label_for = badge_labels.get(region.constraint_type)
+            label = label_for(region) if label_for is not None else "?"
+            if label is None:
+                continue  # Skip "empty" regions with no constraint
 
-            badge_color = self.BADGE_COLORS[region.id % len(self.BADGE_COLORS)]
-            cx, cy, edge = self._find_badge_position(region, x_start, y_start, cell_size, all_cells_set)
-            badges.append([cx, cy, edge, badge_color, label, region.id])
+            cx, cy, edge = find_badge_position(region, x_start, y_start, cell_size, cell_ids,
+                                               grid_bounds=grid_bounds)
+            badges.append([cx, cy, edge, badge_colors[region.id], label, region.id])
 
-        # Resolve collisions - nudge overlapping badges apart
+        # Resolve collisions - nudge overlapping badges apart. Positions live in
+        # parallel lists for the relaxation and are written back afterwards
         min_dist = badge_size * 1.2  # Minimum distance between badge centers
         max_iterations = 10
+        # Over-relax each nudge so clusters settle in fewer passes, and stop
+        # once no badge moves by a visible amount
+        omega = 1.5
+        converged = 0.01 * min_dist
+        min_dist_sq = min_dist * min_dist
+        xs = [badge[0] for badge in badges]
+        ys = [badge[1] for badge in badges]
+        # Top/bottom badges slide along x, left/right badges along y
+        along_x = [badge[2] in ("top", "bottom") for badge in badges]
 
         for _ in range(max_iterations):
-            moved = False
-            for i in range(len(badges)):
-                for j in range(i + 1, len(badges)):
-                    cx1, cy1, edge1 = badges[i][0], badges[i][1], badges[i][2]
-                    cx2, cy2, edge2 = badges[j][0], badges[j][1], badges[j][2]
-
-                    dx = cx2 - cx1
-                    dy = cy2 - cy1
-                    dist = math.sqrt(dx * dx + dy * dy)
-
-                    if dist < min_dist and dist > 0:
-                        # Push apart along the direction between them
-                        overlap = (min_dist - dist) / 2
-                        dx /= dist
-                        dy /= dist
-
-                        # Move along the edge direction primarily
-                        if edge1 in ("top", "bottom"):
-                            badges[i][0] -= overlap * (1 if dx > 0 else -1)
-                            badges[j][0] += overlap * (1 if dx > 0 else -1)
-                        else:  # left, right
-                            badges[i][1] -= overlap * (1 if dy > 0 else -1)
-                            badges[j][1] += overlap * (1 if dy > 0 else -1)
-                        moved = True
-
-            if not moved:
+            max_delta = 0.0
+            # Bucket badges on a min_dist grid; only badges in the same or an
+            # adjacent bucket can be closer than min_dist
+            buckets: Dict[Tuple[int, int], List[int]] = {}
+            for i in range(len(xs)):
+                key = (int(xs[i] // min_dist), int(ys[i] // min_dist))
+                buckets.setdefault(key, []).append(i)
+
+            for (bx, by), members in buckets.items():
+                neighbors = []
+                for nx in (bx - 1, bx, bx + 1):
+                    for ny in (by - 1, by, by + 1):
+                        neighbors.extend(buckets.get((nx, ny), ()))
+                neighbors.sort()
+
+                for i in members:
+                    for j in neighbors:
+                        if j <= i:
+                            continue
+                        dx = xs[j] - xs[i]
+                        dy = ys[j] - ys[i]
+                        dist_sq = dx * dx + dy * dy
+
+                        # Compare squared distances; only overlapping pairs need the root
+                        if dist_sq < min_dist_sq and dist_sq > 0:
+                            # Push apart along the direction between them
+                            overlap = omega * (min_dist - math.sqrt(dist_sq)) / 2
+
+                            # Move along the edge direction primarily
+                            if along_x[i]:
+                                step = overlap if dx > 0 else -overlap
+                                xs[i] -= step
+                                xs[j] += step
+                            else:  # left, right
+                                step = overlap if dy > 0 else -overlap
+                                ys[i] -= step
+                                ys[j] += step
+                            if overlap > max_delta:
+                                max_delta = overlap
+
+            if max_delta < converged:
                 break
 
-        # Draw all badges
-        for cx, cy, edge, badge_color, label, _ in badges:
+        # Draw all badges, with white text for contrast on colored backgrounds
+        self.pdf.set_text_color(255, 255, 255)
+        for badge, cx, cy in zip(badges, xs, ys):
+            _, _, edge, badge_color, label, _ = badge
             self._draw_semicircle_badge(cx, cy, badge_size, badge_color, label, edge)
 
     def draw_supply(self, x_start: float, y_start: float, max_width: float,
@@ -813,6 +977,10 @@ class PuzzleRenderer:
         if placed_dominoes is None:
             placed_dominoes = set()
 
+        # Split into placed slots and tiles still in hand, so the placeholders
+        # go down in one pass before the tiles
+        slots = []
+        tiles = []
         for i, domino in enumerate(dominoes):
             col = i % cols
             row = i // cols
@@ -820,14 +988,20 @@ class PuzzleRenderer:
             y = y_start + row * domino_h
 
             # Check if this domino has been placed
-            domino_key = (domino.low, domino.high)
-            is_placed = domino_key in placed_dominoes
-
-            if is_placed:
-                # Draw faded placeholder
-                self._draw_empty_domino_slot(x, y, cell_size)
+            if (domino.low, domino.high) in placed_dominoes:
+                slots.append((x, y))
             else:
-                self.draw_domino_tile(x, y, domino, horizontal=True, cell_size=cell_size)
+                tiles.append((x, y, domino))
+
+        # Draw faded placeholders
+        for x, y in slots:
+            self._draw_empty_domino_slot(x, y, cell_size)
+
+        for x, y, domino in tiles:
+            self._queue_domino_tile(x, y, domino, horizontal=True, cell_size=cell_size)
+
+        # Tiles don't overlap, so every tile's pips can go down in one fill
+        self._flush_pips()
 
     def _draw_empty_domino_slot(self, x: float, y: float, cell_size: float):
         """Draw a faded empty slot where a domino was."""
@@ -835,24 +1009,32 @@ class PuzzleRenderer:
         w, h = cell_size * 2, cell_size
 
         # Faded pinkish-beige color
-        self.pdf.set_fill_color(235, 225, 220)
+        self._set_fill_color(235, 225, 220)
         self._draw_rounded_rect(x, y, w, h, corner_r, fill=True, stroke=False)
 
+    def _new_pdf(self) -> FPDF:
+        """A blank letter-size FPDF, with the Unicode badge font if available."""
+        pdf = FPDF(orientation='P', unit='mm', format='letter')
+        pdf.set_auto_page_break(auto=False)
+        # Add Unicode font for special characters like ≠
+        import os
+        font_path = os.path.join(os.path.dirname(__file__), 'DejaVuSans-Bold.ttf')
+        if os.path.exists(font_path):
+            pdf.add_font('DejaVu', '', font_path)
+            self.unicode_font = 'DejaVu'
+        else:
+            self.unicode_font = None
+        return pdf
+
     def render(self, output_path: str, include_solution: bool = True):
         """Render the complete puzzle to PDF."""
         # Calculate grid dimensions
-        all_cells = []
-        for region in self.puzzle.regions:
-            all_cells.extend(region.cells)
-
-        if not all_cells:
+        grid_bounds = self._grid_bounds()
+        if not grid_bounds:
             print("No cells to render!")
             return
 
-        min_r = min(c[0] for c in all_cells)
-        max_r = max(c[0] for c in all_cells)
-        min_c = min(c[1] for c in all_cells)
-        max_c = max(c[1] for c in all_cells)
+        min_r, min_c, max_r, max_c = grid_bounds
 
         grid_rows = max_r - min_r + 1
         grid_cols = max_c - min_c + 1
@@ -884,21 +1066,19 @@ class PuzzleRenderer:
         if use_landscape:
             split_pages = True
 
-        # Create new PDF with correct orientation
+        # Draw into the PDF made in __init__ while it is still blank; parsing
+        # the TTF font dominates setting one up. Pages carry their own
+        # orientation, so the document default doesn't need to match
         orientation = 'L' if use_landscape else 'P'
-        self.pdf = FPDF(orientation=orientation, unit='mm', format='letter')
-        self.pdf.set_auto_page_break(auto=False)
-        # Re-add Unicode font for the new PDF instance
-        import os
-        font_path = os.path.join(os.path.dirname(__file__), 'DejaVuSans-Bold.ttf')
-        if os.path.exists(font_path):
-            self.pdf.add_font('DejaVu', '', font_path)
+        if self.pdf.page:
+            self.pdf = self._new_pdf()
+            self._reset_graphics_state()
 
         page_w = landscape_w if use_landscape else portrait_w
         page_h = landscape_h if use_landscape else portrait_h
 
         # Page 1: Grid (no label - clean for solving)
-        self.pdf.add_page()
+        self.pdf.add_page(orientation=orientation)
 
         # Grid (centered both horizontally and vertically)
         # Account for badge overhang (~10mm beyond grid edges)
@@ -912,9 +1092,9 @@ class PuzzleRenderer:
 
         if split_pages:
             # Page 2: Supply (separate page)
-            self.pdf.add_page()
+            self.pdf.add_page(orientation=orientation)
 
-            self.pdf.set_font('Helvetica', 'B', 20)
+            self._set_font('Helvetica', 'B', 20)
             self.pdf.set_text_color(40, 40, 40)
             self.pdf.set_xy(0, 15)
             self.pdf.cell(0, 10, self.puzzle.difficulty.upper(), align='C')
@@ -925,8 +1105,8 @@ class PuzzleRenderer:
         else:
             # Supply on same page
             sep_y = grid_y + grid_height + 25
-            self.pdf.set_draw_color(200, 200, 200)
-            self.pdf.set_line_width(0.5)
+            self._set_draw_color(200, 200, 200)
+            self._set_line_width(0.5)
             self.pdf.line(margin, sep_y, page_w - margin, sep_y)
 
             supply_y = sep_y + 15
@@ -935,10 +1115,10 @@ class PuzzleRenderer:
 
         # Solution page (smaller grid since we don't need to write on it)
         if include_solution and self.puzzle.solution:
-            self.pdf.add_page()
+            self.pdf.add_page(orientation=orientation)
 
             # Centered header like supply page
-            self.pdf.set_font('Helvetica', 'B', 20)
+            self._set_font('Helvetica', 'B', 20)
             self.pdf.set_text_color(40, 40, 40)
             self.pdf.set_xy(0, 15)
             self.pdf.cell(0, 10, f"{self.puzzle.difficulty.upper()} SOLUTION", align='C')
@@ -954,12 +1134,20 @@ class PuzzleRenderer:
         print(f"Saved puzzle to: {output_path}")
 
 
+def _render_one(puzzle: Puzzle) -> None:
+    """Pool worker: render one puzzle to a PDF named after it."""
+    filename = f"{puzzle.name.lower().replace(' ', '_')}.pdf"
+    PuzzleRenderer(puzzle).render(filename)
+
+
 if __name__ == "__main__":
+    from concurrent.futures import ProcessPoolExecutor
+    import multiprocessing
+
     from puzzles import get_all_puzzles
 
-    # Render all puzzles
+    # Render all puzzles. Each worker builds its own renderer and FPDF, so
+    # the puzzles are independent and render in parallel
     puzzles = get_all_puzzles()
-    for puzzle in puzzles:
-        renderer = PuzzleRenderer(puzzle)
-        filename = f"{puzzle.name.lower().replace(' ', '_')}.pdf"
-        renderer.render(filename)
+    with ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn")) as executor:
+        list(executor.map(_render_one, puzzles))
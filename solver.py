@@ -2,22 +2,30 @@
 Backtracking solver for domino placement puzzles.
 Supports multiple constraint types: Sum, Equal, Greater, Less.
 """
-from typing import List, Dict, Set, Tuple, Optional
-from dataclasses import dataclass
-from copy import deepcopy
+from typing import List, Dict, Sequence, Set, Tuple, Optional
+from dataclasses import dataclass, field
 
 from domino_sets import Domino, DominoSet
-from grid import Puzzle, Region, PlacedDomino, Orientation, ConstraintType
+from grid import (Puzzle, PlacedDomino, Orientation,
+                  SUM_CODE, EQUAL_CODE, GREATER_CODE, LESS_CODE)
 
 
 @dataclass
 class SolverState:
     """Current state of the solver."""
     placed: List[PlacedDomino]
-    used_dominoes: Set[Domino]
-    filled_cells: Set[Tuple[int, int]]
-    # Track which pip value is at each cell for constraint checking
-    cell_values: Dict[Tuple[int, int], int]
+    # Bit i set when puzzle.supply.dominoes[i] has been placed
+    used_mask: int
+    # Bit i set when Solver.cells[i] is covered
+    filled_mask: int
+    # Pip value at each cell index; only meaningful where filled_mask is set
+    values: bytearray
+    # Per region, by index into puzzle.regions: running pip total and pip
+    # multiset, kept in step with values, and cells still empty (0 means the
+    # region is complete)
+    region_sum: List[int] = field(default_factory=list)
+    region_values: List[Dict[int, int]] = field(default_factory=list)
+    region_unfilled: List[int] = field(default_factory=list)
 
 
 class Solver:
@@ -36,13 +44,65 @@ class Solver:
             for cell in region.cells:
                 self.cell_to_region[cell] = region.id
 
-        self.region_by_id: Dict[int, Region] = {r.id: r for r in puzzle.regions}
-
         # All cells that need to be filled
         self.all_cells: Set[Tuple[int, int]] = set()
         for region in puzzle.regions:
             self.all_cells.update(region.cells)
 
+        # Cells are numbered 0..N-1 so the search can keep coverage in an
+        # int bitmask and pip values in a bytearray. Numbering runs from the
+        # bottom-right corner: _choose_cell breaks MRV ties by index, and
+        # that order explores far fewer nodes than top-left first
+        self.cells: List[Tuple[int, int]] = sorted(self.all_cells, reverse=True)
+        self.cell_index: Dict[Tuple[int, int], int] = {cell: i for i, cell in enumerate(self.cells)}
+        # Regions likewise by their index in puzzle.regions; the search reads
+        # constraints from these flat tables rather than Region objects
+        region_index = {r.id: k for k, r in enumerate(puzzle.regions)}
+        self.cell_region: List[int] = [region_index[self.cell_to_region[cell]] for cell in self.cells]
+        self._region_ctype: List[int] = [r._ctype_code for r in puzzle.regions]
+        # GREATER/LESS regions compare against their linked region, or -1
+        # when unlinked, against their own target_value (NYT "less"/"greater")
+        self._region_link: List[int] = []
+        for r in puzzle.regions:
+            linked = -1
+            if r._ctype_code in (GREATER_CODE, LESS_CODE) and r.linked_region_id is not None:
+                if r.linked_region_id not in region_index:
+                    raise ValueError(f"Region {r.id} links to unknown region {r.linked_region_id}")
+                linked = region_index[r.linked_region_id]
+            self._region_link.append(linked)
+        # GREATER/LESS regions to re-check when the region they link to completes
+        self._region_dependents: List[List[int]] = [[] for _ in puzzle.regions]
+        for k, linked in enumerate(self._region_link):
+            if linked >= 0:
+                self._region_dependents[linked].append(k)
+        self._full_mask = (1 << len(self.cells)) - 1
+
+        # Neighbor indices of each cell index, paired with the placement
+        # orientation and anchor (top/left cell) of a domino covering both
+        self.adjacency: List[Tuple[Tuple[int, Orientation, int, int], ...]] = []
+        for cell in self.cells:
+            r, c = cell
+            entries = []
+            for adj in self.get_adjacent_cells(cell):
+                if adj[0] == r:  # Same row = horizontal
+                    orient = Orientation.HORIZONTAL
+                else:
+                    orient = Orientation.VERTICAL
+                ar, ac = min(cell, adj)
+                entries.append((self.cell_index[adj], orient, ar, ac))
+            self.adjacency.append(tuple(entries))
+
+    def reset(self, dominoes: List[Domino], targets: Sequence[Optional[int]]) -> None:
+        """
+        Reuse this solver for a new supply and new region targets on the same
+        region layout. targets holds one target_value per region, in
+        puzzle.regions order. Updates the puzzle in place.
+        """
+        self.puzzle.supply = DominoSet(dominoes)
+        for region, target in zip(self.puzzle.regions, targets):
+            region.target_value = target
+        self.solutions = []
+
     def get_adjacent_cells(self, cell: Tuple[int, int]) -> List[Tuple[int, int]]:
         """Get adjacent cells within the grid."""
         r, c = cell
@@ -54,98 +114,119 @@ class Solver:
                 adjacent.append(neighbor)
         return adjacent
 
-    def get_region_sum(self, region_id: int, cell_values: Dict[Tuple[int, int], int]) -> int:
-        """Calculate sum of pips in a region."""
-        region = self.region_by_id[region_id]
-        total = 0
-        for cell in region.cells:
-            if cell in cell_values:
-                total += cell_values[cell]
-        return total
-
-    def get_region_values(self, region_id: int, cell_values: Dict[Tuple[int, int], int]) -> List[int]:
-        """Get all pip values in a region."""
-        region = self.region_by_id[region_id]
-        values = []
-        for cell in region.cells:
-            if cell in cell_values:
-                values.append(cell_values[cell])
-        return values
-
-    def is_region_complete(self, region_id: int, filled_cells: Set[Tuple[int, int]]) -> bool:
-        """Check if all cells in region are filled."""
-        region = self.region_by_id[region_id]
-        return all(cell in filled_cells for cell in region.cells)
-
-    def check_constraint(self, region: Region, cell_values: Dict[Tuple[int, int], int],
-                        filled_cells: Set[Tuple[int, int]], partial_ok: bool = True) -> bool:
+    def _check_placed(self, k: int, state: SolverState) -> bool:
         """
-        Check if a region's constraint is satisfied.
-        If partial_ok=True, incomplete regions pass (for mid-solve checking).
+        Check region index k's constraint after a placement, reading the
+        running region totals in state; an incomplete region passes unless
+        it can no longer be satisfied.
+        Once k is complete this is also its final check, along with that of
+        any complete GREATER/LESS region comparing against it, so a full
+        board that got here needs no separate verification.
         """
-        is_complete = self.is_region_complete(region.id, filled_cells)
+        region_unfilled = state.region_unfilled
+        ctype = self._region_ctype[k]
+        if ctype == SUM_CODE:
+            if not region_unfilled[k]:
+                if state.region_sum[k] != self._region_target[k]:
+                    return False
+            elif state.region_sum[k] > self._region_target[k]:
+                return False
 
-        if region.constraint_type == ConstraintType.SUM:
-            current_sum = self.get_region_sum(region.id, cell_values)
-            if is_complete:
-                return current_sum == region.target_value
-            else:
-                # Partial: sum so far shouldn't exceed target
-                return partial_ok and current_sum <= region.target_value
-
-        elif region.constraint_type == ConstraintType.EQUAL:
-            values = self.get_region_values(region.id, cell_values)
-            if not values:
-                return True
-            first = values[0]
-            if not all(v == first for v in values):
+        elif ctype == EQUAL_CODE:
+            # All values so far are equal
+            if len(state.region_values[k]) > 1:
+                return False
+
+        elif ctype == GREATER_CODE or ctype == LESS_CODE:
+            # Can't check until both are complete
+            if not self._compare_linked(k, state):
                 return False
-            return True  # All values so far are equal
-
-        elif region.constraint_type == ConstraintType.GREATER:
-            if not is_complete:
-                return partial_ok  # Can't check until complete
-            linked = self.region_by_id[region.linked_region_id]
-            if not self.is_region_complete(linked.id, filled_cells):
-                return partial_ok
-            my_sum = self.get_region_sum(region.id, cell_values)
-            their_sum = self.get_region_sum(linked.id, cell_values)
-            return my_sum > their_sum
-
-        elif region.constraint_type == ConstraintType.LESS:
-            if not is_complete:
-                return partial_ok
-            linked = self.region_by_id[region.linked_region_id]
-            if not self.is_region_complete(linked.id, filled_cells):
-                return partial_ok
-            my_sum = self.get_region_sum(region.id, cell_values)
-            their_sum = self.get_region_sum(linked.id, cell_values)
-            return my_sum < their_sum
 
+        if not region_unfilled[k]:
+            for dependent in self._region_dependents[k]:
+                if not self._compare_linked(dependent, state):
+                    return False
         return True
 
+    def _compare_linked(self, k: int, state: SolverState) -> bool:
+        """
+        GREATER/LESS check for region index k; passes until both it and its
+        linked region are complete. An unlinked region is compared against
+        its target_value instead.
+        """
+        linked = self._region_link[k]
+        greater = self._region_ctype[k] == GREATER_CODE
+        my_sum = state.region_sum[k]
+        if linked < 0:
+            # Unlinked: compare against the region's own target
+            target = self._region_target[k]
+            if state.region_unfilled[k]:
+                # Pips only add, so a LESS total already at the target fails
+                return greater or my_sum < target
+            return my_sum > target if greater else my_sum < target
+        if state.region_unfilled[k] or state.region_unfilled[linked]:
+            return True
+        their_sum = state.region_sum[linked]
+        return my_sum > their_sum if greater else my_sum < their_sum
+
+    def _feasible_pips(self, k: int, state: SolverState) -> Sequence[int]:
+        """
+        Pip values one more cell of region index k could take: no more than a
+        SUM region's remaining total, or an EQUAL region's value once it has one.
+        """
+        ctype = self._region_ctype[k]
+        if ctype == SUM_CODE and self._region_target[k] is not None:
+            room = self._region_target[k] - state.region_sum[k]
+            return [p for p in self._supply_pips if p <= room]
+        elif ctype == EQUAL_CODE:
+            values = state.region_values[k]
+            if values:
+                return tuple(values)
+        return self._supply_pips
+
     def solve(self) -> int:
         """
         Solve the puzzle and return number of unique solutions.
         Solutions are deduplicated by which dominoes are in which regions.
         """
         self.solutions = []
-        self.seen_assignments: Set[frozenset] = set()
+        self.seen_assignments: Set[bytes] = set()
+
+        # Supply dominoes by the pip they can put on the chosen cell, each
+        # with its used_mask bit and the pip that lands on its neighbor, in
+        # supply order. Rebuilt per solve since reset() swaps the supply
+        self._dominoes_by_pip: Dict[int, List[Tuple[int, Domino, int]]] = {}
+        for i, domino in enumerate(self.puzzle.supply.dominoes):
+            bit = 1 << i
+            self._dominoes_by_pip.setdefault(domino.low, []).append((bit, domino, domino.high))
+            if domino.low != domino.high:
+                self._dominoes_by_pip.setdefault(domino.high, []).append((bit, domino, domino.low))
+        self._supply_pips: Tuple[int, ...] = tuple(sorted(self._dominoes_by_pip))
+        self._region_target: List[Optional[int]] = [r.target_value for r in self.puzzle.regions]
+        for k, region in enumerate(self.puzzle.regions):
+            compared = region._ctype_code in (GREATER_CODE, LESS_CODE)
+            if compared and self._region_link[k] < 0 and region.target_value is None:
+                raise ValueError(f"Region {region.id} has neither a linked region nor a target")
+
         initial_state = SolverState(
             placed=[],
-            used_dominoes=set(),
-            filled_cells=set(),
-            cell_values={}
+            used_mask=0,
+            filled_mask=0,
+            values=bytearray(len(self.cells)),
+            region_sum=[0] * len(self.puzzle.regions),
+            region_values=[{} for _ in self.puzzle.regions],
+            region_unfilled=[len(r.cells) for r in self.puzzle.regions]
         )
         self._backtrack(initial_state)
         return len(self.solutions)
 
-    def _get_solution_signature(self, state: SolverState) -> frozenset:
+    def _get_solution_signature(self, state: SolverState) -> bytes:
         """
         Get a signature for a solution based on pip values at each cell.
         Two solutions are the same if they result in identical pip placements.
+        Cells always appear in index order, so the values alone identify it.
         """
-        return frozenset(state.cell_values.items())
+        return bytes(state.values)
 
     def _backtrack(self, state: SolverState) -> None:
         """Recursive backtracking."""
@@ -153,107 +234,119 @@ class Solver:
             return
 
         # Check if solved
-        if len(state.filled_cells) == len(self.all_cells):
-            # Verify all constraints
-            if self._verify_all_constraints(state):
-                # Deduplicate by domino-to-region assignment
-                sig = self._get_solution_signature(state)
-                if sig not in self.seen_assignments:
-                    self.seen_assignments.add(sig)
-                    self.solutions.append(deepcopy(state.placed))
+        filled = state.filled_mask
+        if filled == self._full_mask:
+            # Every region was finally checked as its last cell was placed
+            # Deduplicate by domino-to-region assignment
+            sig = self._get_solution_signature(state)
+            if sig not in self.seen_assignments:
+                self.seen_assignments.add(sig)
+                # Placements are never mutated, so a shallow copy is enough
+                self.solutions.append(list(state.placed))
             return
 
         # Find next unfilled cell
         cell = self._choose_cell(state)
-        if cell is None:
+        if cell is None or cell < 0:
             return
 
-        # Try placing each unused domino
-        for domino in self.puzzle.supply.dominoes:
-            if domino in state.used_dominoes:
+        # Placements are made on the shared state in place and undone after
+        # each recursive call, so no per-branch dicts or sets are allocated
+        placed = state.placed
+        used = state.used_mask
+        values = state.values
+        region_sum = state.region_sum
+        region_values = state.region_values
+        region_unfilled = state.region_unfilled
+
+        rid_cell = self.cell_region[cell]
+        values_cell = region_values[rid_cell]
+        pips_at_cell = self._feasible_pips(rid_cell, state)
+        dominoes_by_pip = self._dominoes_by_pip
+
+        # Try each adjacent empty cell; every neighbor in the table is
+        # in some region
+        for adj, orient, r, c in self.adjacency[cell]:
+            if filled >> adj & 1:
                 continue
-
-            # Try each adjacent empty cell
-            for adj in self.get_adjacent_cells(cell):
-                if adj in state.filled_cells:
-                    continue
-
-                # Both cells must be in valid regions (but can be DIFFERENT regions!)
-                if cell not in self.cell_to_region or adj not in self.cell_to_region:
-                    continue
-
-                # Try both orientations of the domino
-                orientations = [(domino.low, domino.high)]
-                if domino.low != domino.high:
-                    orientations.append((domino.high, domino.low))
-
-                for pip_at_cell, pip_at_adj in orientations:
-                    # Create new state
-                    new_cell_values = dict(state.cell_values)
-                    new_cell_values[cell] = pip_at_cell
-                    new_cell_values[adj] = pip_at_adj
-
-                    # Check constraints for affected regions
-                    valid = True
-                    affected_regions = {self.cell_to_region[cell], self.cell_to_region[adj]}
-                    new_filled = state.filled_cells | {cell, adj}
-
-                    for rid in affected_regions:
-                        region = self.region_by_id[rid]
-                        if not self.check_constraint(region, new_cell_values, new_filled, partial_ok=True):
-                            valid = False
-                            break
-
-                    if not valid:
-                        continue
-
-                    # Determine grid orientation for PlacedDomino
-                    if cell[0] == adj[0]:  # Same row = horizontal
-                        if cell[1] < adj[1]:
-                            r, c = cell
+            pair_filled = filled | (1 << cell) | (1 << adj)
+
+            rid_adj = self.cell_region[adj]
+            values_adj = region_values[rid_adj]
+            pips_at_adj = self._feasible_pips(rid_adj, state)
+
+            # Only unused dominoes whose two pips each cell's region could
+            # accept on its own
+            for pip_at_cell in pips_at_cell:
+                for bit, domino, pip_at_adj in dominoes_by_pip[pip_at_cell]:
+                    if pip_at_adj in pips_at_adj and not used & bit:
+                        values[cell] = pip_at_cell
+                        values[adj] = pip_at_adj
+                        state.filled_mask = pair_filled
+                        region_sum[rid_cell] += pip_at_cell
+                        region_sum[rid_adj] += pip_at_adj
+                        values_cell[pip_at_cell] = values_cell.get(pip_at_cell, 0) + 1
+                        values_adj[pip_at_adj] = values_adj.get(pip_at_adj, 0) + 1
+                        region_unfilled[rid_cell] -= 1
+                        region_unfilled[rid_adj] -= 1
+
+                        # Check constraints for affected regions
+                        if (self._check_placed(rid_cell, state)
+                                and (rid_adj == rid_cell or self._check_placed(rid_adj, state))):
+                            placed.append(PlacedDomino(domino, r, c, orient))
+                            state.used_mask = used | bit
+
+                            self._backtrack(state)
+
+                            state.used_mask = used
+                            placed.pop()
+
+                        # Undo this placement; drop zero counts so a region's
+                        # distinct values stay the count dict's keys. Stale
+                        # entries in values are masked off by filled_mask
+                        state.filled_mask = filled
+                        region_sum[rid_cell] -= pip_at_cell
+                        region_sum[rid_adj] -= pip_at_adj
+                        region_unfilled[rid_cell] += 1
+                        region_unfilled[rid_adj] += 1
+                        if values_cell[pip_at_cell] == 1:
+                            del values_cell[pip_at_cell]
                         else:
-                            r, c = adj
-                        orient = Orientation.HORIZONTAL
-                    else:  # Same column = vertical
-                        if cell[0] < adj[0]:
-                            r, c = cell
+                            values_cell[pip_at_cell] -= 1
+                        if values_adj[pip_at_adj] == 1:
+                            del values_adj[pip_at_adj]
                         else:
-                            r, c = adj
-                        orient = Orientation.VERTICAL
-
-                    placement = PlacedDomino(domino, r, c, orient)
-                    new_state = SolverState(
-                        placed=state.placed + [placement],
-                        used_dominoes=state.used_dominoes | {domino},
-                        filled_cells=new_filled,
-                        cell_values=new_cell_values
-                    )
-
-                    self._backtrack(new_state)
-
-                    if len(self.solutions) >= self.max_solutions:
-                        return
-
-    def _choose_cell(self, state: SolverState) -> Optional[Tuple[int, int]]:
-        """Choose next unfilled cell using MRV heuristic."""
-        unfilled = self.all_cells - state.filled_cells
-        if not unfilled:
-            return None
-
-        # Prefer cells in regions with fewer unfilled cells (more constrained)
-        def region_unfilled_count(cell):
-            rid = self.cell_to_region[cell]
-            region = self.region_by_id[rid]
-            return sum(1 for c in region.cells if c not in state.filled_cells)
-
-        return min(unfilled, key=region_unfilled_count)
-
-    def _verify_all_constraints(self, state: SolverState) -> bool:
-        """Verify all region constraints are satisfied."""
-        for region in self.puzzle.regions:
-            if not self.check_constraint(region, state.cell_values, state.filled_cells, partial_ok=False):
-                return False
-        return True
+                            values_adj[pip_at_adj] -= 1
+
+                        if len(self.solutions) >= self.max_solutions:
+                            return
+
+    def _choose_cell(self, state: SolverState) -> Optional[int]:
+        """
+        Choose next unfilled cell index using MRV heuristic. Returns -1 if
+        some empty cell has no empty neighbor left: as in exact cover, a
+        column with no candidate rows means this branch cannot be completed.
+        """
+        filled = state.filled_mask
+        cell_region = self.cell_region
+        region_unfilled = state.region_unfilled
+        best = None
+        best_unfilled = 0
+        for i, neighbors in enumerate(self.adjacency):
+            if filled >> i & 1:
+                continue
+            for adj, _, _, _ in neighbors:
+                if not filled >> adj & 1:
+                    break
+            else:
+                return -1  # Isolated cell; no domino can cover it
+
+            # Prefer cells in regions with fewer unfilled cells (more constrained)
+            unfilled = region_unfilled[cell_region[i]]
+            if best is None or unfilled < best_unfilled:
+                best = i
+                best_unfilled = unfilled
+        return best
 
     def get_solution(self) -> Optional[List[PlacedDomino]]:
         """Return first solution if exists."""